@@ -5,7 +5,9 @@ Demonstrates basic parsing with JSON categorization (recommended approach)
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, List
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -14,6 +16,23 @@ from src.parsers import PNCStatementParser
 from src.pdf_ingester import PDFIngester
 from src.csv_exporter import CSVExporter
 from src.data_processor import DataProcessor
+from src.year_processor import iter_pdf_files
+
+
+# Reuse one parser/ingester/exporter across examples so categories.json is only loaded once
+@lru_cache(maxsize=1)
+def _get_parser() -> PNCStatementParser:
+    return PNCStatementParser()
+
+
+@lru_cache(maxsize=1)
+def _get_ingester() -> PDFIngester:
+    return PDFIngester()
+
+
+@lru_cache(maxsize=1)
+def _get_exporter() -> CSVExporter:
+    return CSVExporter()
 
 
 def example_basic_parsing():
@@ -22,10 +41,10 @@ def example_basic_parsing():
     print("-" * 40)
     
     # Initialize components
-    ingester = PDFIngester()
-    parser = PNCStatementParser()  # Includes JSON categorization
+    ingester = _get_ingester()
+    parser = _get_parser()  # Includes JSON categorization
     processor = DataProcessor()
-    exporter = CSVExporter()
+    exporter = _get_exporter()
     
     # Process a PDF file
     pdf_file = Path("path/to/your/statement.pdf")
@@ -36,8 +55,7 @@ def example_basic_parsing():
         combined_text = ingester.handle_multi_page_documents(pages_text)
         
         # Parse transactions with categorization
-        transactions = parser.extract_transaction_data(combined_text)
-        statement_summary = parser.parse_account_info(combined_text)
+        transactions, statement_summary = parser.parse_all(combined_text, source_file=pdf_file.name)
         
         # Clean and validate data
         cleaned_transactions = processor.clean_transaction_data(transactions)
@@ -48,9 +66,7 @@ def example_basic_parsing():
         
         # Export to CSV
         output_file = Path("output/transactions.csv")
-        exporter.create_google_sheets_compatible_format(
-            final_transactions, output_file, pdf_file.name
-        )
+        exporter.create_google_sheets_compatible_format(final_transactions, output_file)
         
         print(f"Extracted {len(final_transactions)} transactions")
         print(f"Categories applied from src/categories.json")
@@ -59,22 +75,50 @@ def example_basic_parsing():
         print(f"Please provide a valid PDF file path")
 
 
+def _load_category_patterns(categories_file: Path) -> Dict[str, List[str]]:
+    """Read categories.json into {category: patterns}, using the fastest decoder installed"""
+    data = categories_file.read_bytes()
+    
+    try:
+        import msgspec
+    except ImportError:
+        msgspec = None
+    
+    if msgspec:
+        # Typed decode validates the schema and skips building intermediate dicts
+        class Category(msgspec.Struct):
+            patterns: List[str] = []
+        
+        class Categories(msgspec.Struct):
+            categories: Dict[str, Category] = {}
+        
+        decoded = msgspec.json.decode(data, type=Categories)
+        return {name: category.patterns for name, category in decoded.categories.items()}
+    
+    try:
+        import orjson
+        loads = orjson.loads
+    except ImportError:
+        import json
+        loads = json.loads
+    
+    categories = loads(data).get('categories', {})
+    return {name: category.get('patterns', []) for name, category in categories.items()}
+
+
 def example_category_customization():
     """Example of customizing transaction categories"""
     print("\nCategory Customization Example")
     print("-" * 35)
     
     # Show how to view current categories
-    import json
     categories_file = Path("src/categories.json")
     
     if categories_file.exists():
-        with open(categories_file, 'r') as f:
-            categories = json.load(f)
+        categories = _load_category_patterns(categories_file)
         
         print("Current categories in src/categories.json:")
-        for category_name, category_data in categories.get('categories', {}).items():
-            patterns = category_data.get('patterns', [])
+        for category_name, patterns in categories.items():
             print(f"  {category_name}: {', '.join(patterns[:3])}{'...' if len(patterns) > 3 else ''}")
         
         print("\nTo add new categories:")
@@ -101,40 +145,38 @@ def example_batch_processing():
     print("-" * 30)
     
     # Initialize components
-    ingester = PDFIngester()
-    parser = PNCStatementParser()
+    ingester = _get_ingester()
+    parser = _get_parser()
     processor = DataProcessor()
-    exporter = CSVExporter()
+    exporter = _get_exporter()
     
     # Process all PDFs in a directory
     pdf_directory = Path("path/to/statements/")
     
     if pdf_directory.exists():
-        pdf_files = list(pdf_directory.glob("*.pdf"))
         all_transactions = []
+        file_count = 0
+        seen = {}  # Dedupe keys shared across statements
         
-        for pdf_file in pdf_files:
+        # Files are yielded as they are found, so processing starts immediately
+        for pdf_file in iter_pdf_files(pdf_directory):
             print(f"Processing {pdf_file.name}...")
+            file_count += 1
             
             # Extract and parse
             pages_text = ingester.extract_text_content(pdf_file)
             combined_text = ingester.handle_multi_page_documents(pages_text)
-            transactions = parser.extract_transaction_data(combined_text)
-            
-            # Clean and validate
-            cleaned_transactions = processor.clean_transaction_data(transactions)
-            final_transactions = processor.handle_duplicate_transactions(cleaned_transactions)
+            transactions = parser.extract_transaction_data(combined_text, source_file=pdf_file.name)
             
-            all_transactions.extend(final_transactions)
+            # Clean and drop repeats from overlapping statements without intermediate lists
+            cleaned = processor.iter_clean_transaction_data(transactions)
+            all_transactions.extend(processor.drop_cross_file_duplicates(cleaned, pdf_file.name, seen))
         
         # Export all transactions to single CSV
         output_file = Path("output/all_transactions.csv")
-        source_files = ", ".join(f.name for f in pdf_files)
-        exporter.create_google_sheets_compatible_format(
-            all_transactions, output_file, source_files
-        )
+        exporter.create_google_sheets_compatible_format(all_transactions, output_file)
         
-        print(f"\nTotal: {len(all_transactions)} transactions from {len(pdf_files)} files")
+        print(f"\nTotal: {len(all_transactions)} transactions from {file_count} files")
         print(f"All transactions categorized using JSON configuration")
         print(f"Saved to {output_file}")
     else:
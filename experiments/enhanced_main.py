@@ -2,22 +2,33 @@
 
 import click
 import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache, partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 import sys
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Enhanced parser moved to experiments/ - now deprecated
+# PDF, parser and export modules pull in pdfplumber/pandas, so they are imported on
+# first use below; --help and argument errors don't pay for them
 try:
-    from .pdf_ingester import PDFIngester
-    from .parsers import PNCStatementParser
     from .data_processor import DataProcessor
-    from .csv_exporter import CSVExporter
+    from .year_processor import iter_pdf_files
+    from .text_cache import TextCache
 except ImportError:
-    from pdf_ingester import PDFIngester
-    from parsers import PNCStatementParser
     from data_processor import DataProcessor
-    from csv_exporter import CSVExporter
+    from year_processor import iter_pdf_files
+    from text_cache import TextCache
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +37,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_HEADER_RULE = "=" * 40
+_SECTION_RULE = "-" * 20
+
+
+# Stateless components are built once per process (including each pool worker) so
+# categories.json is read and the parser's patterns compiled only once
+@lru_cache(maxsize=1)
+def _get_parser():
+    try:
+        from .parsers import PNCStatementParser
+    except ImportError:
+        from parsers import PNCStatementParser
+    return PNCStatementParser()
+
+
+@lru_cache(maxsize=1)
+def _get_ingester():
+    try:
+        from .pdf_ingester import PDFIngester
+    except ImportError:
+        from pdf_ingester import PDFIngester
+    return PDFIngester()
+
+
+@lru_cache(maxsize=1)
+def _get_exporter():
+    try:
+        from .csv_exporter import CSVExporter
+    except ImportError:
+        from csv_exporter import CSVExporter
+    return CSVExporter()
+
+
+@lru_cache(maxsize=1)
+def _get_text_cache(cache_dir: Path) -> TextCache:
+    return TextCache(cache_dir)
+
 
 @click.command()
 @click.option('--file', '-f', type=click.Path(exists=True, path_type=Path), 
@@ -34,10 +82,6 @@ logger = logging.getLogger(__name__)
               help='Directory containing PDF statements to process')
 @click.option('--output', '-o', type=click.Path(path_type=Path), required=True,
               help='Output CSV file path')
-@click.option('--enhanced', is_flag=True, default=False,
-              help='[DEPRECATED] Enhanced parsing moved to experiments/ - use basic parser')
-@click.option('--basic', is_flag=True, default=True,
-              help='Use reliable text-based parsing with JSON categorization (recommended)')
 @click.option('--monthly', is_flag=True, 
               help='Create separate CSV files for each month')
 @click.option('--summary', type=click.Path(path_type=Path),
@@ -48,15 +92,16 @@ logger = logging.getLogger(__name__)
               help='Enable verbose logging')
 @click.option('--validate-only', is_flag=True,
               help='Only validate files without generating output')
-@click.option('--compare-methods', is_flag=True,
-              help='Compare enhanced vs basic parsing methods')
-def main(file, directory, output, enhanced, basic, monthly, summary, 
-         validation_report, verbose, validate_only, compare_methods):
+@click.option('--cache-dir', type=click.Path(file_okay=False, path_type=Path),
+              help='Reuse extracted PDF text from this directory across runs (stores statement text on disk)')
+def main(file, directory, output, monthly, summary, 
+         validation_report, verbose, validate_only, cache_dir):
     """
     PNC Statement Parser - Convert PNC bank statement PDFs to CSV format.
     
-    Uses reliable text-based parsing with JSON categorization by default.
-    Enhanced coordinate-based parsing has been deprecated and moved to experiments/.
+    Uses reliable text-based parsing with JSON categorization.
+    The enhanced coordinate-based parser and its --enhanced/--basic/--compare-methods
+    flags have been removed; see experiments/enhanced_parser.py.
     
     Examples:
         # Basic parsing with categorization (recommended)
@@ -78,32 +123,18 @@ def main(file, directory, output, enhanced, basic, monthly, summary,
         click.echo("Error: Cannot specify both --file and --directory", err=True)
         sys.exit(1)
     
-    # Deprecation warning for enhanced parsing
-    if enhanced:
-        click.echo("⚠ WARNING: Enhanced parsing has been deprecated and moved to experiments/", err=True)
-        click.echo("⚠ Using basic parser instead (recommended for reliability)", err=True)
-        enhanced = False
-    
     try:
-        # Get list of files to process
-        pdf_files = []
         if file:
             pdf_files = [file]
         else:
-            pdf_files = list(directory.glob("*.pdf"))
+            # Rows are streamed one statement at a time, so sort files for a stable output order
+            pdf_files = sorted(iter_pdf_files(directory), key=lambda x: x.name)
             if not pdf_files:
                 click.echo(f"No PDF files found in {directory}", err=True)
                 sys.exit(1)
         
-        click.echo(f"Found {len(pdf_files)} PDF file(s) to process")
-        
-        if compare_methods:
-            click.echo("⚠ WARNING: Compare methods feature deprecated - enhanced parser moved to experiments/", err=True)
-            click.echo("Using basic parser only", err=True)
-        
-        # Always use basic parsing now (enhanced is deprecated)
         process_with_basic_method(pdf_files, output, monthly, summary, 
-                                validation_report, validate_only)
+                                validation_report, validate_only, cache_dir)
         
         click.echo("\nProcessing completed successfully!")
         
@@ -113,129 +144,214 @@ def main(file, directory, output, enhanced, basic, monthly, summary,
         sys.exit(1)
 
 
-def process_with_basic_method(pdf_files: List[Path], output: Path,
+def _process_one_pdf(pdf_file: Path, cache_dir: Optional[Path] = None,
+                     validate_only: bool = False) -> Tuple[List, Optional[object], Optional[dict]]:
+    """
+    Parse, clean and validate a single statement.
+    With validate_only, stops after parsing and returns only the validation entry's count.
+    Lives at module level so ProcessPoolExecutor can pickle it for worker processes.
+    Returns (transactions, summary, validation_entry); validation_entry is None when skipped.
+    """
+    ingester = _get_ingester()
+    parser = _get_parser()
+    # DataProcessor accumulates validation errors/warnings, so it stays per-file
+    processor = DataProcessor()
+
+    # Basic parsing with categorization
+    cache = _get_text_cache(cache_dir) if cache_dir else None
+    pages_text = cache.get(pdf_file) if cache else None
+    if pages_text is None:
+        pages_text = ingester.extract_text_content_mmap(pdf_file)
+        if cache and pages_text:
+            cache.put(pdf_file, pages_text)
+    if not pages_text:
+        click.echo(f"Warning: No text extracted from {pdf_file.name}", err=True)
+        return [], None, None
+
+    combined_text = ingester.handle_multi_page_documents(pages_text)
+    # Header is parsed once and shared with transaction extraction
+    transactions, statement_summary = parser.parse_all(combined_text, source_file=pdf_file.name)
+
+    if not transactions:
+        click.echo(f"Warning: No transactions found in {pdf_file.name}", err=True)
+        return [], None, None
+
+    if validate_only:
+        # Only the count is used, so don't pickle the transactions back to the parent
+        return [], None, {
+            'file': pdf_file.name,
+            'transaction_count': len(transactions),
+            'method': 'basic_with_categorization'
+        }
+
+    # Clean and validate
+    cleaned_transactions = processor.clean_transaction_data(transactions)
+    if statement_summary:
+        processor.validate_data_integrity(cleaned_transactions, statement_summary)
+
+    # Duplicates are dropped across files by the caller, which sees every statement
+
+    # Basic validation info
+    validation_entry = {
+        'file': pdf_file.name,
+        'transaction_count': len(cleaned_transactions),
+        'method': 'basic_with_categorization'
+    }
+    return cleaned_transactions, statement_summary, validation_entry
+
+
+def _iter_processed_pdfs(pdf_files: Iterable[Path], worker=_process_one_pdf):
+    """Yield (pdf_file, worker(pdf_file)) pairs, fanning out to a process pool for multi-file runs"""
+    cpus = os.cpu_count() or 1
+    pending = iter(pdf_files)
+    # Peek one file per CPU so short runs don't start workers that would sit idle
+    head = list(islice(pending, max(cpus, 2)))
+    if len(head) < 2:
+        # Pool start-up costs more than it saves for a single statement
+        for pdf_file in head:
+            yield pdf_file, worker(pdf_file)
+        return
+
+    pending = chain(head, pending)
+    workers = min(cpus, len(head))
+    # Keep a bounded read-ahead window so workers stay busy reading and parsing the
+    # next statements while the caller writes results, without queueing every file at once
+    window = 2 * workers
+    in_flight = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for pdf_file in islice(pending, window):
+            in_flight.append((pdf_file, executor.submit(worker, pdf_file)))
+
+        while in_flight:
+            pdf_file, future = in_flight.popleft()
+            next_file = next(pending, None)
+            if next_file is not None:
+                in_flight.append((next_file, executor.submit(worker, next_file)))
+            yield pdf_file, future.result()
+
+
+def process_with_basic_method(pdf_files: Iterable[Path], output: Path,
                             monthly: bool, summary_path: Path, validation_report: Path, 
-                            validate_only: bool):
+                            validate_only: bool, cache_dir: Optional[Path] = None):
     """Process files with basic parser (enhanced parsing is deprecated)"""
     
     click.echo("Using reliable text-based parsing with JSON categorization...")
+    click.echo("✓ Categories applied from JSON configuration")
+    
+    exporter = _get_exporter()
     
-    ingester = PDFIngester()
-    parser = PNCStatementParser()
     processor = DataProcessor()
-    exporter = CSVExporter()
     
-    all_transactions = []
     all_summaries = []
     validation_data = []
+    total_count = 0
+    file_count = 0
+    first_file = last_file = None
+    # Dedupe key -> first source file, shared across files so overlapping statements
+    # don't emit the same transaction twice
+    seen = {}
     
-    for pdf_file in pdf_files:
-        click.echo(f"Processing: {pdf_file.name}")
-        
-        # Basic parsing with categorization
-        pages_text = ingester.extract_text_content(pdf_file)
-        if not pages_text:
-            click.echo(f"Warning: No text extracted from {pdf_file.name}", err=True)
-            continue
-        
-        combined_text = ingester.handle_multi_page_documents(pages_text)
-        transactions = parser.extract_transaction_data(combined_text)
-        statement_summary = parser.parse_account_info(combined_text)
-        
-        if not transactions:
-            click.echo(f"Warning: No transactions found in {pdf_file.name}", err=True)
-            continue
-        
-        if statement_summary:
-            all_summaries.append(statement_summary)
-        
-        # Clean and validate
-        cleaned_transactions = processor.clean_transaction_data(transactions)
-        if statement_summary:
-            processor.validate_data_integrity(cleaned_transactions, statement_summary)
-        
-        final_transactions = processor.handle_duplicate_transactions(cleaned_transactions)
-        all_transactions.extend(final_transactions)
-        
-        click.echo(f"  Extracted {len(final_transactions)} transactions")
-        click.echo(f"  ✓ Categories applied from JSON configuration")
+    # Validation-only runs skip cleaning, dedupe and export entirely
+    worker = partial(_process_one_pdf, cache_dir=cache_dir, validate_only=validate_only)
+    
+    output_path = Path(output)
+    monthly_dir = output_path.parent / f"{output_path.stem}_monthly" if monthly else None
+    
+    with ExitStack() as stack:
+        stream = None
+        if not validate_only:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            stream = stack.enter_context(exporter.open_stream(output_path, monthly_dir))
         
-        # Basic validation info
-        validation_data.append({
-            'file': pdf_file.name,
-            'transaction_count': len(final_transactions),
-            'method': 'basic_with_categorization'
-        })
+        # Files are independent, so they are parsed in parallel and each file's rows are
+        # written as soon as it arrives rather than held until every file is done
+        for pdf_file, (final_transactions, statement_summary, validation_entry) in _iter_processed_pdfs(pdf_files, worker):
+            file_count += 1
+            first_file = first_file or pdf_file.name
+            last_file = pdf_file.name
+            if validation_entry is None:
+                continue
+            
+            if statement_summary:
+                all_summaries.append(statement_summary)
+            if stream is not None:
+                final_transactions = processor.drop_cross_file_duplicates(final_transactions, pdf_file.name, seen)
+                validation_entry['transaction_count'] = len(final_transactions)
+                stream.append(final_transactions)
+            transaction_count = validation_entry['transaction_count']
+            total_count += transaction_count
+            
+            # One log record per file instead of three echo calls
+            logger.info(f"Processed {pdf_file.name}: {transaction_count} transactions")
+            
+            validation_data.append(validation_entry)
     
     # Save basic validation report if requested
     if validation_report:
-        with open(validation_report, 'w') as f:
-            json.dump(validation_data, f, indent=2, default=str)
+        if orjson:
+            Path(validation_report).write_bytes(
+                orjson.dumps(validation_data, option=orjson.OPT_INDENT_2, default=str)
+            )
+        else:
+            with open(validation_report, 'w') as f:
+                json.dump(validation_data, f, indent=2, default=str)
         click.echo(f"Processing report saved: {validation_report}")
     
     if validate_only:
-        click.echo(f"\nValidation completed for {len(all_transactions)} transactions")
+        click.echo(f"\nValidation completed for {total_count} transactions from {file_count} file(s)")
         return
     
-    if not all_transactions:
+    if not total_count:
+        output_path.unlink(missing_ok=True)
         click.echo("No transactions found in any files", err=True)
         sys.exit(1)
     
-    click.echo(f"\nTotal transactions extracted: {len(all_transactions)}")
-    
-    # Generate outputs
-    output_path = Path(output)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Main CSV export
-    source_files = ", ".join(f.name for f in pdf_files)
-    success = exporter.create_google_sheets_compatible_format(
-        all_transactions, output_path, source_files
-    )
-    
-    if success:
-        click.echo(f"Exported transactions to: {output_path}")
-    else:
-        click.echo("Failed to export main CSV file", err=True)
-        sys.exit(1)
+    click.echo(f"\nTotal transactions extracted: {total_count} from {file_count} file(s)")
+    # Per-row provenance lives in the Source_File column; only a digest is logged here
+    logger.info(f"Sources: {file_count} files: {first_file}..{last_file}")
+    click.echo(f"Exported transactions to: {output_path}")
     
-    # Monthly exports if requested
-    if monthly:
-        monthly_dir = output_path.parent / f"{output_path.stem}_monthly"
-        success = exporter.export_monthly_files(all_transactions, monthly_dir, source_files)
-        if success:
-            click.echo(f"Exported monthly files to: {monthly_dir}")
+    if monthly_dir is not None:
+        click.echo(f"Exported monthly files to: {monthly_dir}")
     
     # Summary report if requested
     if summary_path:
-        create_basic_summary_report(all_transactions, validation_data, summary_path)
+        create_basic_summary_report(total_count, validation_data, summary_path)
         click.echo(f"Generated summary report: {summary_path}")
 
 
-def create_basic_summary_report(transactions: List, validation_data: List, 
+def create_basic_summary_report(transaction_count: int, validation_data: List, 
                               summary_path: Path):
     """Create summary report for basic parsing"""
-    with open(summary_path, 'w') as f:
-        f.write("PNC Statement Processing Summary\n")
-        f.write("=" * 40 + "\n\n")
-        
-        f.write(f"Total transactions processed: {len(transactions)}\n")
-        f.write(f"Files processed: {len(validation_data)}\n\n")
-        
+    lines = [
+        "PNC Statement Processing Summary",
+        _HEADER_RULE,
+        "",
+        f"Total transactions processed: {transaction_count}",
+        f"Files processed: {len(validation_data)}",
+        "",
         # Processing summary
-        f.write("Processing Summary:\n")
-        f.write("-" * 20 + "\n")
-        
-        for file_data in validation_data:
-            f.write(f"✓ {file_data['file']}: {file_data['transaction_count']} transactions\n")
-        
-        # Method information
-        f.write(f"\nParsing method: Basic text-based parsing\n")
-        f.write(f"Features used:\n")
-        f.write(f"  • Text pattern matching\n")
-        f.write(f"  • JSON-based categorization\n") 
-        f.write(f"  • Transaction type detection\n")
-        f.write(f"  • Description cleaning\n")
+        "Processing Summary:",
+        _SECTION_RULE,
+    ]
+    lines.extend(
+        f"✓ {file_data['file']}: {file_data['transaction_count']} transactions"
+        for file_data in validation_data
+    )
+    # Method information
+    lines.extend([
+        "",
+        "Parsing method: Basic text-based parsing",
+        "Features used:",
+        "  • Text pattern matching",
+        "  • JSON-based categorization",
+        "  • Transaction type detection",
+        "  • Description cleaning",
+    ])
+    
+    # One write through a large buffer instead of a write call per file
+    with open(summary_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write("\n".join(lines) + "\n")
 
 
 if __name__ == '__main__':
@@ -10,7 +10,7 @@ import logging
 from pathlib import Path
 
 from .models import Transaction, StatementSummary
-from .layout_analyzer import LayoutAnalyzer, TextElement
+from .layout_analyzer import LayoutAnalyzer, TextElementArray
 from .pnc_parser import PNCStatementParser
 
 logger = logging.getLogger(__name__)
@@ -22,20 +22,62 @@ class EnhancedPNCParser(PNCStatementParser):
     Implements coordinate-based filtering and improved validation.
     """
     
-    def __init__(self):
+    # Patterns are compiled once at import time and shared by every instance
+    
+    # Enhanced amount pattern to handle leading dots
+    ENHANCED_AMOUNT_PATTERN = re.compile(r'(\.?\d{1,3}(?:,\d{3})*\.?\d{0,2})')
+    
+    # Full amount string: optional $ and sign, digits with commas, optional fraction
+    AMOUNT_PARTS_PATTERN = re.compile(r'\$?(?P<sign>-)?\$?(?P<int>[\d,]*)(?:\.(?P<frac>\d*))?')
+    
+    # Deletes $ and , from an amount string in one pass
+    AMOUNT_STRIP_TABLE = str.maketrans('', '', '$,')
+    
+    # Patterns for section total extraction
+    SECTION_TOTAL_PATTERNS = {
+        'deposits': re.compile(r'There were?\s+\d+.*Deposits.*totaling\s*\$?([\d,]+\.\d{2})', re.IGNORECASE),
+        'withdrawals': re.compile(r'There was?\s+\d+.*Withdrawal.*totaling\s*\$?([\d,]+\.\d{2})', re.IGNORECASE),
+        'online_banking': re.compile(r'There were?\s+\d+.*Banking Deductions.*totaling\s*\$?([\d,]+\.\d{2})', re.IGNORECASE)
+    }
+    
+    # Bucket order used by _calculate_parsed_totals
+    PARSED_TOTAL_SECTIONS = ('deposits', 'withdrawals', 'online_banking')
+    
+    # Section headers as one alternation; lastgroup names the section a header opens
+    SECTION_HEADER_PATTERN = re.compile(
+        r'(?P<deposits>Deposits\s+and\s+Other\s+Additions)'
+        r'|(?P<withdrawals>Banking/Debit\s+Card\s+Withdrawals\s*and\s*Purchases)'
+        r'|(?P<online_banking>Online\s+and\s+Electronic\s+Banking\s+Deductions)'
+        r'|(?P<daily_balance>Daily Balance Detail)',
+        re.IGNORECASE
+    )
+    
+    # Sections that hold transactions, in output order, with their transaction type
+    SECTION_TRANSACTION_TYPES = {
+        'deposits': 'CREDIT',
+        'withdrawals': 'DEBIT',
+        'online_banking': 'DEBIT'
+    }
+    
+    PAGE_MARKER_PATTERN = re.compile(r'--- PAGE (\d+) ---')
+    
+    # Debits whose description mentions ACH count as online banking; searched
+    # case-insensitively so descriptions are never copied just to lowercase them
+    ACH_DESCRIPTION_PATTERN = re.compile(r'ach', re.IGNORECASE)
+    
+    # Balance labels as one alternation, so each balance is found in a single scan
+    OPENING_BALANCE_PATTERN = re.compile(
+        r'(?:Opening|Beginning|Previous) Balance.*?\$?([\d,]+\.\d{2})', re.IGNORECASE
+    )
+    
+    CLOSING_BALANCE_PATTERN = re.compile(
+        r'(?:Closing|Ending|Current) Balance.*?\$?([\d,]+\.\d{2})', re.IGNORECASE
+    )
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
         super().__init__()
-        self.layout_analyzer = LayoutAnalyzer()
+        self.layout_analyzer = LayoutAnalyzer(cache_dir)
         self.column_bands = None
-        
-        # Enhanced amount pattern to handle leading dots
-        self.ENHANCED_AMOUNT_PATTERN = re.compile(r'(\.?\d{1,3}(?:,\d{3})*\.?\d{0,2})')
-        
-        # Patterns for section total extraction
-        self.SECTION_TOTAL_PATTERNS = {
-            'deposits': re.compile(r'There were?\s+\d+.*Deposits.*totaling\s*\$?([\d,]+\.\d{2})', re.IGNORECASE),
-            'withdrawals': re.compile(r'There was?\s+\d+.*Withdrawal.*totaling\s*\$?([\d,]+\.\d{2})', re.IGNORECASE),
-            'online_banking': re.compile(r'There were?\s+\d+.*Banking Deductions.*totaling\s*\$?([\d,]+\.\d{2})', re.IGNORECASE)
-        }
     
     def extract_transaction_data_enhanced(self, pdf_path: Path) -> Tuple[List[Transaction], Dict[str, Any]]:
         """
@@ -64,20 +106,8 @@ class EnhancedPNCParser(PNCStatementParser):
             logger.error("Could not parse statement header")
             return [], {}
         
-        # Extract transactions from each section
-        transactions = []
-        
-        # Extract deposits
-        deposits = self._extract_deposits_section_enhanced(filtered_text, summary, text_elements)
-        transactions.extend(deposits)
-        
-        # Extract withdrawals
-        withdrawals = self._extract_withdrawals_section_enhanced(filtered_text, summary, text_elements)
-        transactions.extend(withdrawals)
-        
-        # Extract online banking
-        online_banking = self._extract_online_banking_section_enhanced(filtered_text, summary, text_elements)
-        transactions.extend(online_banking)
+        # Extract deposits, withdrawals and online banking in one walk over the text
+        transactions = self._extract_all_sections(filtered_text, summary)
         
         # Perform enhanced validation
         validation_data = self._perform_enhanced_validation(transactions, summary, filtered_text)
@@ -109,44 +139,56 @@ class EnhancedPNCParser(PNCStatementParser):
         
         return transactions, validation_data
     
-    def _reconstruct_filtered_text(self, main_table_elements: List[TextElement]) -> str:
+    def _reconstruct_filtered_text(self, main_table_elements: TextElementArray) -> str:
         """Reconstruct text from coordinate-filtered elements"""
         lines = self.layout_analyzer.reconstruct_lines_from_coordinates(main_table_elements)
         return '\n'.join(lines)
     
-    def _extract_deposits_section_enhanced(self, filtered_text: str, summary: StatementSummary, 
-                                         _text_elements: List[TextElement]) -> List[Transaction]:
-        """Enhanced deposits extraction with coordinate awareness"""
-        # Use original section extraction but with enhanced amount parsing
-        deposits = self._extract_deposits_section(filtered_text, summary)
-        
-        # Enhance amount parsing for each transaction
-        for transaction in deposits:
-            transaction.amount = self._parse_enhanced_amount(str(transaction.amount))
-        
-        return deposits
-    
-    def _extract_withdrawals_section_enhanced(self, filtered_text: str, summary: StatementSummary,
-                                            _text_elements: List[TextElement]) -> List[Transaction]:
-        """Enhanced withdrawals extraction with coordinate awareness"""
-        withdrawals = self._extract_withdrawals_section(filtered_text, summary)
-        
-        # Enhance amount parsing
-        for transaction in withdrawals:
-            transaction.amount = self._parse_enhanced_amount(str(transaction.amount))
-        
-        return withdrawals
-    
-    def _extract_online_banking_section_enhanced(self, filtered_text: str, summary: StatementSummary,
-                                               _text_elements: List[TextElement]) -> List[Transaction]:
-        """Enhanced online banking extraction with coordinate awareness"""
-        online_banking = self._extract_online_banking_section(filtered_text, summary)
-        
-        # Enhance amount parsing
-        for transaction in online_banking:
-            transaction.amount = self._parse_enhanced_amount(str(transaction.amount))
+    def _extract_all_sections(self, filtered_text: str, summary: StatementSummary) -> List[Transaction]:
+        """
+        Extract every transaction section from a single scan for section headers.
+        A section runs until the next header of a different section, so
+        repeated "continued" headers stay inside it; the first run of each section is used.
+        """
+        bounds = {}
+        current, start = None, 0
+        for header in self.SECTION_HEADER_PATTERN.finditer(filtered_text):
+            section = header.lastgroup
+            if section == current:
+                continue
+            if current in self.SECTION_TRANSACTION_TYPES and current not in bounds:
+                bounds[current] = (start, header.start())
+            current, start = section, header.end()
+        if current in self.SECTION_TRANSACTION_TYPES and current not in bounds:
+            bounds[current] = (start, len(filtered_text))
         
-        return online_banking
+        transactions = []
+        for section, transaction_type in self.SECTION_TRANSACTION_TYPES.items():
+            if section not in bounds:
+                logger.info(f"No {section} section found")
+                continue
+            
+            section_start, section_end = bounds[section]
+            section_text = filtered_text[section_start:section_end]
+            if section == 'online_banking':
+                # Online banking rows carry page context for their dates
+                starting_page = 1
+                for page_marker in self.PAGE_MARKER_PATTERN.finditer(filtered_text, 0, section_start):
+                    starting_page = int(page_marker.group(1))
+                section_transactions = self.transaction_parser.parse_transaction_lines_with_page(
+                    section_text, summary, transaction_type=transaction_type, starting_page=starting_page
+                )
+            else:
+                section_transactions = self.transaction_parser.parse_transaction_lines(
+                    section_text, summary, transaction_type=transaction_type
+                )
+            
+            # Amounts arrive as Decimals parsed once from the raw token (".14" included)
+            transactions.extend(section_transactions)
+            
+            logger.info(f"Found {len(section_transactions)} {section} transactions")
+        
+        return transactions
     
     def _parse_enhanced_amount(self, amount_str: str) -> Decimal:
         """
@@ -156,21 +198,18 @@ class EnhancedPNCParser(PNCStatementParser):
         if not amount_str:
             return Decimal('0')
         
-        # Clean the amount string
-        cleaned = amount_str.strip().replace('$', '').replace(',', '')
-        
-        # Handle leading dot case (.14 → 0.14)
-        if cleaned.startswith('.'):
-            cleaned = '0' + cleaned
-        
-        # Handle trailing dot case (14. → 14.00)
-        if cleaned.endswith('.'):
-            cleaned = cleaned + '00'
-        
-        # Handle cases like "14" → "14.00"
-        if '.' not in cleaned and cleaned.isdigit():
-            cleaned = cleaned + '.00'
-        
+        # One match splits the string instead of a chain of replace/startswith checks:
+        # .14 → 0.14, 14. → 14.00, 14 → 14.00
+        match = self.AMOUNT_PARTS_PATTERN.fullmatch(amount_str.strip())
+        if match:
+            int_part = match.group('int').replace(',', '')
+            frac = match.group('frac')
+            if int_part or frac is not None:
+                sign = match.group('sign') or ''
+                return Decimal(f"{sign}{int_part or '0'}.{(frac or '').ljust(2, '0')}")
+        
+        # Anything else (exponents, stray text) goes straight to Decimal as before
+        cleaned = amount_str.strip().translate(self.AMOUNT_STRIP_TABLE)
         try:
             return Decimal(cleaned)
         except (InvalidOperation, ValueError):
@@ -236,21 +275,32 @@ class EnhancedPNCParser(PNCStatementParser):
     
     def _calculate_parsed_totals(self, transactions: List[Transaction]) -> Dict[str, Decimal]:
         """Calculate totals from parsed transactions by type"""
-        parsed_totals = {
-            'deposits': Decimal('0'),
-            'withdrawals': Decimal('0'),
-            'online_banking': Decimal('0')
-        }
+        # Bucket order matches PARSED_TOTAL_SECTIONS; accumulate integer cents and
+        # build one Decimal per bucket at the end
+        deposits, withdrawals, online_banking = range(3)
+        bucket_cents = [0, 0, 0]
+        # Only a handful of distinct categories exist, so test each one once
+        online_categories = {}
+        is_ach = self.ACH_DESCRIPTION_PATTERN.search
         
         for transaction in transactions:
             if transaction.transaction_type == 'CREDIT':
-                parsed_totals['deposits'] += transaction.amount
-            elif 'online' in transaction.category.lower() or 'ach' in transaction.description.lower():
-                parsed_totals['online_banking'] += transaction.amount
+                bucket = deposits
             else:
-                parsed_totals['withdrawals'] += transaction.amount
+                category = transaction.category
+                is_online = online_categories.get(category)
+                if is_online is None:
+                    is_online = online_categories[category] = 'online' in category.lower()
+                if is_online or is_ach(transaction.description):
+                    bucket = online_banking
+                else:
+                    bucket = withdrawals
+            bucket_cents[bucket] += transaction.amount_cents
         
-        return parsed_totals
+        return {
+            section: Decimal(cents).scaleb(-2)
+            for section, cents in zip(self.PARSED_TOTAL_SECTIONS, bucket_cents)
+        }
     
     def _reconcile_section_totals(self, statement_totals: Dict[str, Decimal], 
                                 parsed_totals: Dict[str, Decimal]) -> Dict[str, Any]:
@@ -307,9 +357,16 @@ class EnhancedPNCParser(PNCStatementParser):
             balance_check['error'] = "Could not extract opening/closing balances"
             return balance_check
         
-        # Calculate balance from transactions
-        total_credits = sum(t.amount for t in transactions if t.transaction_type == 'CREDIT')
-        total_debits = sum(t.amount for t in transactions if t.transaction_type == 'DEBIT')
+        # Calculate balance from transactions in integer cents
+        credit_cents = 0
+        debit_cents = 0
+        for t in transactions:
+            if t.transaction_type == 'CREDIT':
+                credit_cents += t.amount_cents
+            elif t.transaction_type == 'DEBIT':
+                debit_cents += t.amount_cents
+        total_credits = Decimal(credit_cents).scaleb(-2)
+        total_debits = Decimal(debit_cents).scaleb(-2)
         
         calculated_closing = opening_balance + total_credits - total_debits
         difference = abs(calculated_closing - closing_balance)
@@ -331,36 +388,10 @@ class EnhancedPNCParser(PNCStatementParser):
     
     def _extract_opening_balance(self, text: str) -> Optional[Decimal]:
         """Extract opening balance from statement text"""
-        patterns = [
-            re.compile(r'Opening Balance.*?\$?([\d,]+\.\d{2})', re.IGNORECASE),
-            re.compile(r'Beginning Balance.*?\$?([\d,]+\.\d{2})', re.IGNORECASE),
-            re.compile(r'Previous Balance.*?\$?([\d,]+\.\d{2})', re.IGNORECASE)
-        ]
-        
-        for pattern in patterns:
-            match = pattern.search(text)
-            if match:
-                try:
-                    return Decimal(match.group(1).replace(',', ''))
-                except (InvalidOperation, ValueError):
-                    continue
-        
-        return None
+        match = self.OPENING_BALANCE_PATTERN.search(text)
+        return Decimal(match.group(1).replace(',', '')) if match else None
     
     def _extract_closing_balance(self, text: str) -> Optional[Decimal]:
         """Extract closing balance from statement text"""
-        patterns = [
-            re.compile(r'Closing Balance.*?\$?([\d,]+\.\d{2})', re.IGNORECASE),
-            re.compile(r'Ending Balance.*?\$?([\d,]+\.\d{2})', re.IGNORECASE),
-            re.compile(r'Current Balance.*?\$?([\d,]+\.\d{2})', re.IGNORECASE)
-        ]
-        
-        for pattern in patterns:
-            match = pattern.search(text)
-            if match:
-                try:
-                    return Decimal(match.group(1).replace(',', ''))
-                except (InvalidOperation, ValueError):
-                    continue
-        
-        return None
\ No newline at end of file
+        match = self.CLOSING_BALANCE_PATTERN.search(text)
+        return Decimal(match.group(1).replace(',', '')) if match else None
\ No newline at end of file
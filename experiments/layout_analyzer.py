@@ -3,13 +3,31 @@ Layout-aware PDF analysis module for PNC statements.
 Implements coordinate-based parsing as suggested in ChatGPT plan.
 """
 
+import os
+import numpy as np
 import pdfplumber
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby, repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, NamedTuple
-from collections import defaultdict
+from typing import Iterator, List, Dict, Tuple, Optional, NamedTuple
 import logging
 
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+except ImportError:
+    pdfium = pdfium_c = None
+
+try:
+    from src.text_cache import TextCache
+except ImportError:
+    # Run from inside experiments/: make the repository root importable
+    sys.path.append(str(Path(__file__).parent.parent))
+    from src.text_cache import TextCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,8 +46,43 @@ class TextElement(NamedTuple):
     page_number: int
 
 
+# Word coordinates as stored in TextElementArray; f8 keeps pdfplumber's values exact
+COORD_DTYPE = np.dtype([('x0', 'f8'), ('y0', 'f8'), ('x1', 'f8'), ('y1', 'f8'), ('page', 'i4')])
+
+
+class TextElementArray:
+    """
+    Struct-of-arrays store for extracted words: coordinates live in one NumPy
+    record array (COORD_DTYPE) and texts in a parallel list.
+    Iterating or indexing with an int yields TextElement tuples for row-wise callers.
+    """
+    
+    def __init__(self, texts: List[str], coords: np.ndarray):
+        self.texts = texts
+        self.coords = coords
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def __iter__(self) -> Iterator[TextElement]:
+        for i in range(len(self.texts)):
+            yield self[i]
+    
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            x0, y0, x1, y1, page = self.coords[index].tolist()
+            return TextElement(self.texts[index], BoundingBox(x0, y0, x1, y1), page)
+        return self.take(index)
+    
+    def take(self, index: np.ndarray) -> 'TextElementArray':
+        """Subset by boolean mask or integer index array, preserving order"""
+        positions = np.flatnonzero(index) if index.dtype == bool else index
+        texts = self.texts
+        return TextElementArray([texts[i] for i in positions.tolist()], self.coords[positions])
+
+
 class ColumnBands:
-    """Represents detected column boundaries in the statement"""
+    """Represents detected column boundaries; is_in_* accept a float or an ndarray of x's"""
     def __init__(self, date_band: Tuple[float, float], 
                  amount_band: Tuple[float, float],
                  description_band: Tuple[float, float],
@@ -41,99 +94,202 @@ class ColumnBands:
     
     def is_in_date_column(self, x: float) -> bool:
         """Check if x coordinate is in date column"""
-        return self.date_band[0] <= x <= self.date_band[1]
+        return (self.date_band[0] <= x) & (x <= self.date_band[1])
     
     def is_in_amount_column(self, x: float) -> bool:
         """Check if x coordinate is in amount column"""
-        return self.amount_band[0] <= x <= self.amount_band[1]
+        return (self.amount_band[0] <= x) & (x <= self.amount_band[1])
     
     def is_in_description_column(self, x: float) -> bool:
         """Check if x coordinate is in description column"""
-        return self.description_band[0] <= x <= self.description_band[1]
+        return (self.description_band[0] <= x) & (x <= self.description_band[1])
     
     def is_in_main_table(self, x: float) -> bool:
         """Check if x coordinate is within main transaction table"""
-        return self.date_band[0] <= x <= self.description_band[1]
+        return (self.date_band[0] <= x) & (x <= self.description_band[1])
     
     def is_right_margin_text(self, x: float) -> bool:
         """Check if text is in right margin (likely summary text)"""
         return x > self.description_band[1] + 20  # 20pt buffer
 
 
+# Statements with fewer pages are extracted in-process; pool startup would dominate
+PARALLEL_PAGE_THRESHOLD = 4
+
+
+def _page_word_tuples(page) -> List[Tuple[str, float, float, float, float]]:
+    """Extract (text, x0, bottom, x1, top) for every word on a pdfplumber page"""
+    words = page.extract_words(use_text_flow=False, keep_blank_chars=False)
+    # Release the page's cached objects once its words are collected
+    page.close()
+    return [(w['text'], w['x0'], w['bottom'], w['x1'], w['top']) for w in words]
+
+
+def _extract_page_words(pdf_path: str, page_num: int) -> List[Tuple[str, float, float, float, float]]:
+    """Process pool worker: open the PDF and extract words from a single 1-based page"""
+    with pdfplumber.open(pdf_path, laparams=None) as pdf:
+        return _page_word_tuples(pdf.pages[page_num - 1])
+
+
+def _pdfium_page_word_tuples(page) -> List[Tuple[str, float, float, float, float]]:
+    """
+    Extract (text, x0, bottom, x1, top) for every word on a pypdfium2 page.
+    Characters are split into words on whitespace; loose (font) boxes match
+    pdfplumber's x positions and are flipped to a top-left origin.
+    """
+    height = page.get_height()
+    textpage = page.get_textpage()
+    words = []
+    chars = []
+    boxes = []
+    try:
+        char_count = textpage.count_chars()
+        # One index past the end acts as trailing whitespace to flush the last word
+        for i in range(char_count + 1):
+            char = chr(pdfium_c.FPDFText_GetUnicode(textpage.raw, i)) if i < char_count else ' '
+            if not char.isspace():
+                chars.append(char)
+                boxes.append(textpage.get_charbox(i, loose=True))
+                continue
+            if chars:
+                lefts, bottoms, rights, tops = zip(*boxes)
+                words.append((''.join(chars), min(lefts), height - min(bottoms),
+                              max(rights), height - max(tops)))
+                chars = []
+                boxes = []
+    finally:
+        textpage.close()
+    return words
+
+
 class LayoutAnalyzer:
     """
     Analyzes PDF layout to detect column boundaries and spatial relationships.
     Uses coordinate-based approach for more robust parsing.
     """
     
-    def __init__(self):
-        self.date_pattern = re.compile(r'^\d{1,2}/\d{1,2}$')
-        self.amount_pattern = re.compile(r'^\.?\d{1,3}(?:,\d{3})*\.?\d{0,2}$')
-        self.currency_pattern = re.compile(r'^\$?[\d,]*\.?\d{0,2}$')
+    # Date, amount and currency tokens fused into one alternation; lastgroup names the match.
+    # Alternatives are tried in order, so dates still win over amounts.
+    ELEMENT_CLASSIFIER = re.compile(
+        r'^(?:(?P<date>\d{1,2}/\d{1,2})'
+        r'|(?P<amount>\.?\d{1,3}(?:,\d{3})*\.?\d{0,2})'
+        r'|(?P<currency>\$?[\d,]*\.?\d{0,2}))$'
+    )
+    
+    BACKENDS = ('pdfplumber', 'pdfium')
+    
+    # Dates and amounts sampled before column clustering stops scanning
+    COLUMN_SAMPLE_SIZE = 20
+    
+    def __init__(self, cache_dir: Optional[Path] = None, backend: str = 'pdfplumber'):
+        """
+        backend='pdfium' extracts words with pypdfium2's C text API, which is much
+        faster than pdfminer but splits words on whitespace only, so bands can differ slightly.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown layout backend '{backend}', expected one of {self.BACKENDS}")
+        if backend == 'pdfium' and pdfium is None:
+            raise ImportError("backend='pdfium' requires pypdfium2 (pip install pypdfium2)")
+        self.backend = backend
+        # Word coordinates are cached on disk only when a cache_dir is given
+        self.cache = TextCache(cache_dir, namespace=f"layout-{backend}") if cache_dir else None
     
-    def extract_text_with_coordinates(self, pdf_path: Path) -> List[TextElement]:
+    def extract_text_with_coordinates(self, pdf_path: Path) -> TextElementArray:
         """
         Extract all text elements with their coordinates from PDF.
-        Returns list of TextElement objects.
+        Returns a TextElementArray (coordinates as a NumPy record array).
         """
-        text_elements = []
+        cached = self.cache.get(pdf_path) if self.cache else None
+        if cached is not None:
+            texts, coords = cached
+            logger.info(f"Loaded {len(texts)} cached text elements for {pdf_path}")
+            return TextElementArray(texts, coords)
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # Get individual characters with coordinates
-                    chars = page.chars
-                    
-                    # Group characters into words/text blocks
-                    words = page.extract_words()
-                    
-                    for word in words:
-                        bbox = BoundingBox(
-                            x0=word['x0'], y0=word['bottom'],
-                            x1=word['x1'], y1=word['top']
-                        )
-                        
-                        text_element = TextElement(
-                            text=word['text'],
-                            bbox=bbox,
-                            page_number=page_num
-                        )
-                        
-                        text_elements.append(text_element)
-                        
+            if self.backend == 'pdfium':
+                page_words = self._extract_words_pdfium(pdf_path)
+            else:
+                page_words = self._extract_words_pdfplumber(pdf_path)
         except Exception as e:
             logger.error(f"Failed to extract coordinates from {pdf_path}: {e}")
             raise
         
+        texts = [word[0] for words in page_words for word in words]
+        coords = np.array(
+            [(x0, y0, x1, y1, page_num)
+             for page_num, words in enumerate(page_words, 1)
+             for _, x0, y0, x1, y1 in words],
+            dtype=COORD_DTYPE
+        )
+        text_elements = TextElementArray(texts, coords)
+        if self.cache:
+            self.cache.put(pdf_path, (texts, coords))
+        
         logger.info(f"Extracted {len(text_elements)} text elements with coordinates")
         return text_elements
     
-    def detect_column_bands(self, text_elements: List[TextElement]) -> Optional[ColumnBands]:
+    def _extract_words_pdfplumber(self, pdf_path: Path) -> List[List[Tuple[str, float, float, float, float]]]:
+        """Per-page word tuples via pdfplumber, fanned out to a process pool for long statements"""
+        # laparams=None (the default) skips pdfminer's layout analysis entirely;
+        # word boxes are built straight from the character stream
+        with pdfplumber.open(pdf_path, laparams=None) as pdf:
+            page_count = len(pdf.pages)
+            if page_count < PARALLEL_PAGE_THRESHOLD:
+                return [_page_word_tuples(page) for page in pdf.pages]
+        
+        # Each worker reopens the PDF; pdfplumber objects are not shareable across processes
+        workers = min(os.cpu_count() or 1, page_count)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                _extract_page_words, repeat(str(pdf_path)), range(1, page_count + 1)
+            ))
+    
+    def _extract_words_pdfium(self, pdf_path: Path) -> List[List[Tuple[str, float, float, float, float]]]:
+        """Per-page word tuples via pypdfium2; fast enough that pages are read in-process"""
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            page_words = []
+            for page in pdf:
+                page_words.append(_pdfium_page_word_tuples(page))
+                page.close()
+            return page_words
+        finally:
+            pdf.close()
+    
+    def detect_column_bands(self, text_elements: TextElementArray) -> Optional[ColumnBands]:
         """
         Detect column boundaries by clustering x-positions of dates and amounts.
         Implements the ChatGPT band detection strategy.
         """
-        date_x_positions = []
-        amount_x_positions = []
-        page_width = 0
-        
-        # Find all elements that look like dates or amounts
-        for element in text_elements:
-            # Track page width
-            page_width = max(page_width, element.bbox.x1)
+        x0 = text_elements.coords['x0']
+        page_width = float(text_elements.coords['x1'].max()) if len(text_elements) else 0
+        date_indices = []
+        amount_indices = []
+        classify = self.ELEMENT_CLASSIFIER.match
+        sample_size = self.COLUMN_SAMPLE_SIZE
+        
+        # Find elements that look like dates or amounts, in page order
+        for i, text in enumerate(text_elements.texts):
+            # Classify the token with a single regex dispatch
+            match = classify(text)
+            if match is None:
+                continue
             
-            # Check if this looks like a date
-            if self.date_pattern.match(element.text):
-                date_x_positions.append(element.bbox.x0)
-                logger.debug(f"Found date '{element.text}' at x={element.bbox.x0}")
+            if match.lastgroup == 'date':
+                date_indices.append(i)
+                logger.debug(f"Found date '{text}' at x={x0[i]}")
+            else:
+                amount_indices.append(i)
+                logger.debug(f"Found amount '{text}' at x={x0[i]}")
             
-            # Check if this looks like an amount  
-            elif (self.amount_pattern.match(element.text) or 
-                  self.currency_pattern.match(element.text)):
-                amount_x_positions.append(element.bbox.x0)
-                logger.debug(f"Found amount '{element.text}' at x={element.bbox.x0}")
+            # Column positions settle after a few rows; stop once both samples are full
+            if len(date_indices) >= sample_size and len(amount_indices) >= sample_size:
+                break
         
-        if not date_x_positions or not amount_x_positions:
+        date_x_positions = x0[date_indices]
+        amount_x_positions = x0[amount_indices]
+        
+        if not len(date_x_positions) or not len(amount_x_positions):
             logger.warning("Could not find enough dates or amounts to detect columns")
             return None
         
@@ -161,69 +317,62 @@ class LayoutAnalyzer:
         
         return bands
     
-    def _find_dominant_cluster(self, positions: List[float], tolerance: float = 20) -> Optional[Tuple[float, float]]:
+    def _find_dominant_cluster(self, positions: np.ndarray, tolerance: float = 20) -> Optional[Tuple[float, float]]:
         """
-        Find the dominant cluster of x-positions.
-        Returns (min, max) of the largest cluster.
+        Find the dominant cluster of x-positions: the gap-connected run around
+        their 1pt histogram mode. Returns (min, max) of that cluster.
         """
-        if not positions:
+        if not len(positions):
             return None
         
-        # Sort positions
-        sorted_positions = sorted(positions)
+        xs = np.asarray(positions, dtype=np.float64)
         
-        # Find clusters (positions within tolerance of each other)
-        clusters = []
-        current_cluster = [sorted_positions[0]]
+        # The dominant column is the mode of the x-distribution: histogram at 1pt bins
+        low = np.floor(xs.min())
+        bins = int(np.ceil(xs.max()) - low) + 1
+        hist, edges = np.histogram(xs, bins=bins, range=(low, low + bins))
+        peak = int(hist.argmax())
         
-        for pos in sorted_positions[1:]:
-            if pos - current_cluster[-1] <= tolerance:
-                current_cluster.append(pos)
-            else:
-                clusters.append(current_cluster)
-                current_cluster = [pos]
+        # Grow the column outward from the peak across occupied bins whose gaps stay
+        # within tolerance, so right-aligned columns with varying x0 stay in one band
+        occupied = np.flatnonzero(hist)
+        breaks = np.flatnonzero(np.diff(occupied) > tolerance) + 1
+        run = int(np.searchsorted(breaks, np.searchsorted(occupied, peak), side='right'))
+        first_bin = occupied[breaks[run - 1] if run else 0]
+        last_bin = occupied[(breaks[run] if run < len(breaks) else len(occupied)) - 1]
         
-        clusters.append(current_cluster)
+        in_column = xs[(xs >= edges[first_bin]) & (xs < edges[last_bin + 1])]
         
-        # Find the largest cluster
-        largest_cluster = max(clusters, key=len)
-        
-        return (min(largest_cluster), max(largest_cluster))
+        return (float(in_column.min()), float(in_column.max()))
     
-    def filter_by_coordinates(self, text_elements: List[TextElement], 
-                            bands: ColumnBands) -> Dict[str, List[TextElement]]:
+    def filter_by_coordinates(self, text_elements: TextElementArray, 
+                            bands: ColumnBands) -> Dict[str, TextElementArray]:
         """
         Filter text elements by their coordinate location.
         Returns categorized elements: main_table, right_margin, etc.
         """
+        x = text_elements.coords['x0']
+        
+        # Categorize by location; each mask excludes the ones checked before it
+        right_margin = bands.is_right_margin_text(x)
+        left_margin = ~right_margin & (x < bands.date_band[0] - 20)
+        main_table = ~right_margin & ~left_margin & bands.is_in_main_table(x)
+        
+        # Sub-categorize within main table
+        date_column = main_table & bands.is_in_date_column(x)
+        amount_column = main_table & ~date_column & bands.is_in_amount_column(x)
+        description_column = (main_table & ~date_column & ~amount_column &
+                              bands.is_in_description_column(x))
+        
         categorized = {
-            'main_table': [],
-            'right_margin': [],
-            'left_margin': [],
-            'date_column': [],
-            'amount_column': [],
-            'description_column': []
+            'main_table': text_elements.take(main_table),
+            'right_margin': text_elements.take(right_margin),
+            'left_margin': text_elements.take(left_margin),
+            'date_column': text_elements.take(date_column),
+            'amount_column': text_elements.take(amount_column),
+            'description_column': text_elements.take(description_column)
         }
         
-        for element in text_elements:
-            x = element.bbox.x0
-            
-            # Categorize by location
-            if bands.is_right_margin_text(x):
-                categorized['right_margin'].append(element)
-            elif x < bands.date_band[0] - 20:
-                categorized['left_margin'].append(element)
-            elif bands.is_in_main_table(x):
-                categorized['main_table'].append(element)
-                
-                # Sub-categorize within main table
-                if bands.is_in_date_column(x):
-                    categorized['date_column'].append(element)
-                elif bands.is_in_amount_column(x):
-                    categorized['amount_column'].append(element)
-                elif bands.is_in_description_column(x):
-                    categorized['description_column'].append(element)
-        
         # Log results
         for category, elements in categorized.items():
             logger.debug(f"{category}: {len(elements)} elements")
@@ -257,49 +406,39 @@ class LayoutAnalyzer:
         
         return False
     
-    def reconstruct_lines_from_coordinates(self, text_elements: List[TextElement]) -> List[str]:
+    def reconstruct_lines_from_coordinates(self, text_elements: TextElementArray) -> List[str]:
         """
         Reconstruct text lines from coordinate-aware elements.
         Groups elements by y-coordinate to rebuild lines.
         """
-        # Group elements by page and y-coordinate
-        pages = defaultdict(list)
-        for element in text_elements:
-            pages[element.page_number].append(element)
+        coords = text_elements.coords
+        texts = text_elements.texts
+        y_tolerance = 5  # Points tolerance for same line
         
-        reconstructed_lines = []
+        # Sort by page, then y-coordinate (top to bottom), then x-coordinate (left to right)
+        order = np.lexsort((coords['x0'], -coords['y0'], coords['page']))
+        pages = coords['page'][order]
         
-        for page_num in sorted(pages.keys()):
-            page_elements = pages[page_num]
-            
-            # Sort by y-coordinate (top to bottom), then x-coordinate (left to right)
-            page_elements.sort(key=lambda e: (-e.bbox.y0, e.bbox.x0))
-            
-            # Group elements into lines by y-coordinate
-            lines = []
-            current_line = []
-            current_y = None
-            y_tolerance = 5  # Points tolerance for same line
-            
-            for element in page_elements:
-                if current_y is None or abs(element.bbox.y0 - current_y) <= y_tolerance:
-                    current_line.append(element)
-                    current_y = element.bbox.y0
-                else:
-                    if current_line:
-                        lines.append(current_line)
-                    current_line = [element]
-                    current_y = element.bbox.y0
-            
-            if current_line:
-                lines.append(current_line)
-            
-            # Convert lines to text
+        # A new line starts on a page change or when y drops by more than the tolerance
+        starts_line = np.ones(len(order), dtype=bool)
+        starts_line[1:] = (np.diff(pages) != 0) | (np.diff(coords['y0'][order]) < -y_tolerance)
+        line_ids = np.cumsum(starts_line)
+        
+        # Order each line left to right; lexsort is stable, so x ties keep their order
+        order = order[np.lexsort((coords['x0'][order], line_ids))]
+        line_starts = np.flatnonzero(starts_line).tolist()
+        line_ends = line_starts[1:] + [len(order)]
+        order = order.tolist()
+        
+        line_pages = pages[line_starts].tolist()
+        
+        # Each page contributes its marker plus all of its lines in one extend
+        reconstructed_lines = []
+        for page_num, page_lines in groupby(zip(line_pages, line_starts, line_ends), key=itemgetter(0)):
             reconstructed_lines.append(f"--- PAGE {page_num} ---")
-            for line_elements in lines:
-                # Sort elements in line by x-coordinate
-                line_elements.sort(key=lambda e: e.bbox.x0)
-                line_text = ' '.join(e.text for e in line_elements)
-                reconstructed_lines.append(line_text)
+            reconstructed_lines.extend([
+                ' '.join([texts[i] for i in order[start:end]])
+                for _, start, end in page_lines
+            ])
         
         return reconstructed_lines
\ No newline at end of file
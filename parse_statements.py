@@ -4,9 +4,9 @@ Main entry point for PNC Statement Parser.
 This script provides the command-line interface for processing PNC bank statements.
 """
 
-import sys
-import subprocess
+# The script's directory is on sys.path, so the src package imports directly
+# and the CLI runs in this interpreter instead of a second one
+from src.main import main
 
 if __name__ == '__main__':
-    # Run the main module to avoid import issues
-    subprocess.run([sys.executable, "-m", "src.main"] + sys.argv[1:])
\ No newline at end of file
+    main()
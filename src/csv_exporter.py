@@ -1,17 +1,121 @@
 import csv
-import pandas as pd
+import heapq
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 from datetime import datetime
+from decimal import Decimal
 import logging
 
+import numpy as np
+
 try:
-    from .models import Transaction, StatementSummary
+    from .models import Transaction, StatementSummary, TransactionBatch, TYPE_CREDIT, TYPE_DEBIT
 except ImportError:
-    from models import Transaction, StatementSummary
+    from models import Transaction, StatementSummary, TransactionBatch, TYPE_CREDIT, TYPE_DEBIT
 
 logger = logging.getLogger(__name__)
 
+# Monthly exports with fewer rows are written in-process; pool startup would dominate
+PARALLEL_MONTHLY_ROW_THRESHOLD = 50_000
+
+# Line endings of the original writers: pandas.to_csv used os.linesep for the Google Sheets
+# export, csv.DictWriter used '\r\n' for monthly files. Streamed output must match both.
+SHEETS_LINE_TERMINATOR = os.linesep
+MONTHLY_LINE_TERMINATOR = '\r\n'
+
+
+def _write_month_file(month_file: Path, columns: List[str], rows: List[tuple]) -> int:
+    """Write one monthly CSV (header plus rows); module level so process pool workers can run it"""
+    with open(month_file, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile, lineterminator=MONTHLY_LINE_TERMINATOR)
+        writer.writerow(columns)
+        writer.writerows(rows)
+    return len(rows)
+
+
+class CSVStreamWriter:
+    """
+    Incremental CSV writer that emits rows as each statement is processed.
+    Optionally mirrors rows into per-month files under monthly_dir/YYYY/.
+    Rows are date-sorted within each appended batch only; feed statements in order.
+    """
+
+    def __init__(self, output_path: Path, columns: List[str],
+                 monthly_dir: Optional[Path] = None):
+        self.output_path = Path(output_path)
+        self.columns = columns
+        self.monthly_dir = monthly_dir
+        self.row_count = 0
+        self._file = None
+        self._writer = None
+        self._monthly: Dict[str, tuple] = {}
+
+    def __enter__(self) -> 'CSVStreamWriter':
+        self._file = open(self.output_path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file, lineterminator=SHEETS_LINE_TERMINATOR)
+        self._writer.writerow(self.columns)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def append(self, transactions: List[Transaction]) -> int:
+        """Write one batch of transactions (sorted by date) and return the row count"""
+        rows = sorted(map(self._format_row, transactions), key=itemgetter(0))
+        # The main file gets two-decimal amounts as in create_google_sheets_compatible_format;
+        # monthly files keep the float amounts export_monthly_files writes
+        self._writer.writerows((row[0], f"{row[1]:.2f}", *row[2:]) for row in rows)
+
+        if self.monthly_dir is not None:
+            for row in rows:
+                self._monthly_writer(row[8]).writerow(row)
+
+        self.row_count += len(rows)
+        return len(rows)
+
+    def close(self):
+        """Close the main file and any open monthly files"""
+        for handle, _ in self._monthly.values():
+            handle.close()
+        self._monthly.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _monthly_writer(self, month_key: str):
+        """Return the writer for a YYYY-MM key, opening its file on first use"""
+        entry = self._monthly.get(month_key)
+        if entry is None:
+            year_dir = self.monthly_dir / month_key.split('-')[0]
+            year_dir.mkdir(parents=True, exist_ok=True)
+            handle = open(year_dir / f"transactions_{month_key}.csv", 'w', newline='', encoding='utf-8')
+            writer = csv.writer(handle, lineterminator=MONTHLY_LINE_TERMINATOR)
+            writer.writerow(self.columns)
+            entry = self._monthly[month_key] = (handle, writer)
+        return entry[1]
+
+    @staticmethod
+    def _format_row(transaction: Transaction) -> tuple:
+        """Build a row in CSVExporter.default_columns order, with the amount as float dollars"""
+        return (
+            transaction.full_date.strftime('%Y-%m-%d'),
+            transaction.signed_cents / 100,
+            transaction.transaction_type,
+            transaction.description,
+            transaction.merchant,
+            transaction.card_last_four,
+            transaction.category,
+            transaction.source_file,
+            f"{transaction.year}-{transaction.month:02d}",
+            transaction.page_number,
+        )
+
 
 class CSVExporter:
     """
@@ -19,53 +123,80 @@ class CSVExporter:
     Handles various output formats and summary reporting.
     """
     
+    # Position of 'Month' in default_columns, for grouping formatted rows
+    MONTH_COLUMN = 8
+    
     def __init__(self):
         self.default_columns = [
             'Date', 'Amount', 'Type', 'Description', 'Merchant', 
             'Card', 'Category', 'Source_File', 'Month', 'Page'
         ]
     
-    def format_data_for_export(self, transactions: List[Transaction]) -> List[dict]:
+    def open_stream(self, output_path: Path,
+                    monthly_dir: Optional[Path] = None) -> CSVStreamWriter:
+        """
+        Open a streaming CSV writer for use as a context manager.
+        Rows are written per append() call instead of being buffered.
+        """
+        return CSVStreamWriter(output_path, self.default_columns, monthly_dir)
+
+    def format_data_for_export(self, transactions: Union[List[Transaction], TransactionBatch]) -> List[dict]:
         """
         Format transaction data for CSV export.
         Returns list of dictionaries ready for CSV writing.
         """
-        formatted_data = []
-
-        for transaction in transactions:
-            row = {
-                'Date': transaction.full_date.strftime('%Y-%m-%d'),
-                'Amount': float(transaction.signed_amount),  # Negative for debits
-                'Type': transaction.transaction_type,
-                'Description': transaction.description,
-                'Merchant': transaction.merchant,
-                'Card': transaction.card_last_four,
-                'Category': transaction.category,
-                'Source_File': transaction.source_file,
-                'Month': f"{transaction.year}-{transaction.month:02d}",
-                'Page': transaction.page_number
-            }
-            formatted_data.append(row)
-        
-        # Sort by date
-        formatted_data.sort(key=lambda x: x['Date'])
+        columns = self._export_columns(transactions)
+        names = list(columns)
+        formatted_data = [dict(zip(names, row)) for row in zip(*columns.values())]
         
         logger.info(f"Formatted {len(formatted_data)} transactions for export")
         return formatted_data
     
-    def generate_csv_output(self, transactions: List[Transaction],
+    @staticmethod
+    def _as_batch(transactions: Union[List[Transaction], TransactionBatch]) -> TransactionBatch:
+        """Accept either a columnar batch or a list of Transaction objects"""
+        if isinstance(transactions, TransactionBatch):
+            return transactions
+        return TransactionBatch.from_transactions(transactions)
+    
+    def _export_columns(self, transactions: Union[List[Transaction], TransactionBatch]) -> Dict[str, list]:
+        """
+        Build export data column by column (one list per default column), sorted by date.
+        Columns are sliced out of a TransactionBatch instead of building a dict per row.
+        """
+        batch = self._as_batch(transactions)
+        # Stable sort on the formatted date, matching the old per-row sort
+        batch = batch.take(np.argsort(batch.date, kind='stable'))
+        
+        return {
+            'Date': batch.date.tolist(),
+            'Amount': batch.signed_amounts.tolist(),  # Negative for debits
+            'Type': batch.transaction_type.tolist(),
+            'Description': batch.description.tolist(),
+            'Merchant': batch.merchant.tolist(),
+            'Card': batch.card_last_four.tolist(),
+            'Category': batch.category.tolist(),
+            'Source_File': batch.source_file.tolist(),
+            'Month': [f"{year}-{month:02d}" for year, month in zip(batch.year.tolist(), batch.month.tolist())],
+            'Page': batch.page_number.tolist()
+        }
+    
+    def generate_csv_output(self, transactions: Union[List[Transaction], TransactionBatch],
                           output_path: Path) -> bool:
         """
         Generate CSV file from transactions.
         Returns True if successful.
         """
         try:
-            formatted_data = self.format_data_for_export(transactions)
+            columns = self._export_columns(transactions)
+            logger.info(f"Formatted {len(transactions)} transactions for export")
             
-            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.default_columns)
-                writer.writeheader()
-                writer.writerows(formatted_data)
+            # Rows go to csv.writer positionally (no per-row dicts for DictWriter to
+            # unpack), through a large buffer so the file is written in few syscalls
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.default_columns)
+                writer.writerows(zip(*columns.values()))
             
             logger.info(f"Successfully exported {len(transactions)} transactions to {output_path}")
             return True
@@ -74,29 +205,24 @@ class CSVExporter:
             logger.error(f"Failed to export CSV to {output_path}: {e}")
             return False
     
-    def create_google_sheets_compatible_format(self, transactions: List[Transaction],
+    def create_google_sheets_compatible_format(self, transactions: Union[List[Transaction], TransactionBatch],
                                              output_path: Path) -> bool:
         """
         Create CSV optimized specifically for Google Sheets import.
         Includes proper date formatting and data types.
         """
         try:
-            # Use pandas for better Google Sheets compatibility
-            formatted_data = self.format_data_for_export(transactions)
-            df = pd.DataFrame(formatted_data)
+            columns = self._export_columns(transactions)
+            logger.info(f"Formatted {len(transactions)} transactions for export")
             
-            # Ensure proper data types for Google Sheets
-            df['Date'] = pd.to_datetime(df['Date']).dt.strftime('%Y-%m-%d')
-            df['Amount'] = df['Amount'].astype(float)
+            # Amounts are formatted once to two decimals; csv.writer quotes only the
+            # fields that need it, exactly as pandas.to_csv did, without building a DataFrame
+            columns['Amount'] = [f"{amount:.2f}" for amount in columns['Amount']]
             
-            # Save with specific options for Google Sheets
-            df.to_csv(
-                output_path,
-                index=False,
-                encoding='utf-8',
-                date_format='%Y-%m-%d',
-                float_format='%.2f'
-            )
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile, lineterminator=SHEETS_LINE_TERMINATOR)
+                writer.writerow(self.default_columns)
+                writer.writerows(zip(*columns.values()))
             
             logger.info(f"Exported Google Sheets compatible CSV: {output_path}")
             return True
@@ -105,7 +231,7 @@ class CSVExporter:
             logger.error(f"Failed to create Google Sheets format: {e}")
             return False
     
-    def generate_summary_report(self, transactions: List[Transaction], 
+    def generate_summary_report(self, transactions: Union[List[Transaction], TransactionBatch], 
                               summary: StatementSummary, output_path: Path) -> bool:
         """
         Generate summary report with totals and statistics.
@@ -120,18 +246,38 @@ class CSVExporter:
                 f.write(f"Period: {summary.statement_period_start.strftime('%m/%d/%Y')} to {summary.statement_period_end.strftime('%m/%d/%Y')}\n")
                 f.write(f"Pages: {summary.total_pages}\n\n")
                 
-                # Transaction counts
-                credit_count = len([t for t in transactions if t.transaction_type == 'CREDIT'])
-                debit_count = len([t for t in transactions if t.transaction_type == 'DEBIT'])
+                # Counts and totals are integer-cent reductions over the batch columns
+                batch = self._as_batch(transactions)
+                credit_cents = batch.total_cents(TYPE_CREDIT)
+                debit_cents = batch.total_cents(TYPE_DEBIT)
+                
+                # One pass over the category/merchant columns feeds the aggregates
+                categories = {}
+                merchants = {}
+                signed_amounts = batch.signed_amounts.tolist()
+                for category_name, merchant, signed_amount in zip(
+                        batch.category.tolist(), batch.merchant.tolist(), signed_amounts):
+                    category = categories.get(category_name)
+                    if category is None:
+                        category = categories[category_name] = {'count': 0, 'total': 0}
+                    category['count'] += 1
+                    category['total'] += signed_amount
+                    
+                    if merchant and merchant != "Unknown":
+                        totals = merchants.get(merchant)
+                        if totals is None:
+                            totals = merchants[merchant] = {'count': 0, 'total': 0}
+                        totals['count'] += 1
+                        totals['total'] += abs(signed_amount)
                 
                 f.write(f"Transaction Counts:\n")
-                f.write(f"  Credits: {credit_count}\n")
-                f.write(f"  Debits: {debit_count}\n")
-                f.write(f"  Total: {len(transactions)}\n\n")
+                f.write(f"  Credits: {batch.count(TYPE_CREDIT)}\n")
+                f.write(f"  Debits: {batch.count(TYPE_DEBIT)}\n")
+                f.write(f"  Total: {len(batch)}\n\n")
                 
                 # Amount totals
-                total_credits = sum(t.amount for t in transactions if t.transaction_type == 'CREDIT')
-                total_debits = sum(t.amount for t in transactions if t.transaction_type == 'DEBIT')
+                total_credits = Decimal(credit_cents).scaleb(-2)
+                total_debits = Decimal(debit_cents).scaleb(-2)
                 net_change = total_credits - total_debits
                 
                 f.write(f"Amount Totals:\n")
@@ -140,10 +286,10 @@ class CSVExporter:
                 f.write(f"  Net Change: ${net_change:,.2f}\n\n")
                 
                 # Category breakdown
-                self._write_category_breakdown(f, transactions)
+                self._write_category_breakdown(f, categories)
                 
                 # Merchant summary
-                self._write_merchant_summary(f, transactions)
+                self._write_merchant_summary(f, merchants)
             
             logger.info(f"Generated summary report: {output_path}")
             return True
@@ -152,76 +298,61 @@ class CSVExporter:
             logger.error(f"Failed to generate summary report: {e}")
             return False
     
-    def _write_category_breakdown(self, file, transactions: List[Transaction]):
-        """Write category breakdown to summary file"""
-        categories = {}
-        
-        for transaction in transactions:
-            category = transaction.category
-            if category not in categories:
-                categories[category] = {'count': 0, 'total': 0}
-            
-            categories[category]['count'] += 1
-            categories[category]['total'] += float(transaction.signed_amount)
-        
+    def _write_category_breakdown(self, file, categories: Dict[str, dict]):
+        """Write category breakdown (category -> count/total) to summary file"""
         file.write("Category Breakdown:\n")
         for category, data in sorted(categories.items()):
             file.write(f"  {category}: {data['count']} transactions, ${data['total']:,.2f}\n")
         file.write("\n")
     
-    def _write_merchant_summary(self, file, transactions: List[Transaction]):
-        """Write top merchants to summary file"""
-        merchants = {}
-        
-        for transaction in transactions:
-            merchant = transaction.merchant
-            if merchant and merchant != "Unknown":
-                if merchant not in merchants:
-                    merchants[merchant] = {'count': 0, 'total': 0}
-                
-                merchants[merchant]['count'] += 1
-                merchants[merchant]['total'] += abs(float(transaction.signed_amount))
-        
-        # Sort by total amount
-        sorted_merchants = sorted(merchants.items(), key=lambda x: x[1]['total'], reverse=True)
+    def _write_merchant_summary(self, file, merchants: Dict[str, dict]):
+        """Write top merchants (merchant -> count/total) to summary file"""
+        # Top 10 by total amount; nlargest keeps sorted()'s order for ties without sorting every merchant
+        top_merchants = heapq.nlargest(10, merchants.items(), key=lambda x: x[1]['total'])
         
         file.write("Top Merchants by Amount:\n")
-        for merchant, data in sorted_merchants[:10]:  # Top 10
+        for merchant, data in top_merchants:
             file.write(f"  {merchant}: {data['count']} transactions, ${data['total']:,.2f}\n")
         file.write("\n")
     
-    def export_monthly_files(self, transactions: List[Transaction],
+    def export_monthly_files(self, transactions: Union[List[Transaction], TransactionBatch],
                            output_dir: Path) -> bool:
         """
         Export separate CSV files for each month, organized by year subdirectories.
         Structure: output_dir/YYYY/transactions_YYYY-MM.csv
         """
         try:
-            # Group transactions by month
-            monthly_groups = {}
-            for transaction in transactions:
-                month_key = f"{transaction.year}-{transaction.month:02d}"
-                if month_key not in monthly_groups:
-                    monthly_groups[month_key] = []
-                monthly_groups[month_key].append(transaction)
+            # Format and date-sort every row once, then split the rows by their Month column
+            columns = self._export_columns(transactions)
+            monthly_groups = defaultdict(list)
+            for row in zip(*columns.values()):
+                monthly_groups[row[self.MONTH_COLUMN]].append(row)
 
             # Create base output directory if it doesn't exist
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Export each month to its year subdirectory
-            for month, month_transactions in monthly_groups.items():
+            # Create each year subdirectory up front; monthly files go under YYYY/
+            month_files = []
+            for month in monthly_groups:
                 # Extract year from month key (YYYY-MM format)
-                year = month.split('-')[0]
-
-                # Create year subdirectory
-                year_dir = output_dir / year
+                year_dir = output_dir / month.split('-')[0]
                 year_dir.mkdir(parents=True, exist_ok=True)
+                month_files.append(year_dir / f"transactions_{month}.csv")
+
+            # Each month is independent, so large exports fan the files out to worker processes
+            rows_by_month = list(monthly_groups.values())
+            workers = min(os.cpu_count() or 1, len(month_files))
+            if len(transactions) >= PARALLEL_MONTHLY_ROW_THRESHOLD and workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    counts = list(executor.map(
+                        _write_month_file, month_files, repeat(self.default_columns), rows_by_month
+                    ))
+            else:
+                counts = [_write_month_file(month_file, self.default_columns, rows)
+                          for month_file, rows in zip(month_files, rows_by_month)]
 
-                # Create monthly file in year subdirectory
-                month_file = year_dir / f"transactions_{month}.csv"
-                success = self.generate_csv_output(month_transactions, month_file)
-                if not success:
-                    return False
+            for month_file, count in zip(month_files, counts):
+                logger.info(f"Successfully exported {count} transactions to {month_file}")
 
             logger.info(f"Exported {len(monthly_groups)} monthly files to {output_dir} (organized by year)")
             return True
@@ -1,12 +1,15 @@
 from decimal import Decimal
-from typing import List, Tuple, Set, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Set, Optional, Union
 import logging
+from collections import defaultdict
 from datetime import datetime
 
+import numpy as np
+
 try:
-    from .models import Transaction, StatementSummary
+    from .models import Transaction, StatementSummary, TransactionBatch, TYPE_CODES, TYPE_CREDIT, TYPE_DEBIT, TYPE_OTHER, MAX_AMOUNT_CENTS
 except ImportError:
-    from models import Transaction, StatementSummary
+    from models import Transaction, StatementSummary, TransactionBatch, TYPE_CODES, TYPE_CREDIT, TYPE_DEBIT, TYPE_OTHER, MAX_AMOUNT_CENTS
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +29,32 @@ class DataProcessor:
         Clean and normalize transaction data.
         Handles description cleanup, amount validation, etc.
         """
-        cleaned_transactions = []
+        cleaned_transactions = list(self.iter_clean_transaction_data(transactions))
+        
+        logger.info(f"Cleaned {len(cleaned_transactions)} transactions")
+        return cleaned_transactions
+    
+    def iter_clean_transaction_data(self, transactions: Iterable[Transaction]) -> Iterator[Transaction]:
+        """
+        Generator form of clean_transaction_data.
+        Yields each cleaned transaction so pipelines don't hold intermediate lists.
+        """
+        # Statements repeat a handful of merchants, so each distinct name is cleaned once
+        cleaned_merchants = {}
         
         for transaction in transactions:
             try:
                 # Clean description
                 cleaned_description = self._clean_description(transaction.description)
                 
+                merchant = transaction.merchant
+                try:
+                    cleaned_merchant = cleaned_merchants[merchant]
+                except KeyError:
+                    cleaned_merchant = cleaned_merchants[merchant] = self._clean_merchant_name(merchant)
+                
                 # Validate amount
-                if not self._validate_amount(transaction.amount):
+                if not self._validate_amount(transaction.amount_cents):
                     self.warnings.append(f"Suspicious amount: ${transaction.amount} on {transaction.date}")
                 
                 # Create cleaned transaction
@@ -45,7 +65,7 @@ class DataProcessor:
                     amount=transaction.amount,
                     transaction_type=transaction.transaction_type,
                     description=cleaned_description,
-                    merchant=self._clean_merchant_name(transaction.merchant),
+                    merchant=cleaned_merchant,
                     card_last_four=transaction.card_last_four,
                     category=transaction.category,
                     raw_lines=transaction.raw_lines,
@@ -53,14 +73,12 @@ class DataProcessor:
                     source_file=transaction.source_file
                 )
                 
-                cleaned_transactions.append(cleaned_transaction)
-                
             except Exception as e:
                 logger.error(f"Failed to clean transaction {transaction.date}: {e}")
                 self.validation_errors.append(f"Transaction cleanup failed: {transaction.date} - {e}")
-        
-        logger.info(f"Cleaned {len(cleaned_transactions)} transactions")
-        return cleaned_transactions
+                continue
+            
+            yield cleaned_transaction
     
     def validate_data_integrity(self, transactions: List[Transaction], 
                               summary: StatementSummary) -> bool:
@@ -100,6 +118,35 @@ class DataProcessor:
         # For now, just log duplicates. In production, might want user input
         return transactions
     
+    def drop_cross_file_duplicates(self, transactions: Iterable[Transaction], source_file: str,
+                                   seen: Dict[tuple, str]) -> List[Transaction]:
+        """
+        Drop transactions already produced by a different source file.
+        `seen` maps dedupe keys to the first file that produced them and is updated in place,
+        so repeats within a single statement are kept.
+        """
+        kept = []
+        skipped = 0
+        for transaction in transactions:
+            key = (
+                transaction.year,
+                transaction.date,
+                transaction.amount_cents,
+                transaction.description[:40]
+            )
+            first_file = seen.setdefault(key, source_file)
+            if first_file == source_file:
+                kept.append(transaction)
+            else:
+                skipped += 1
+                self.warnings.append(
+                    f"Skipped duplicate of {first_file} in {source_file}: {transaction.date} {transaction.description[:50]}"
+                )
+        
+        if skipped:
+            logger.warning(f"Skipped {skipped} transactions already seen in other files")
+        return kept
+    
     def calculate_running_balances(self, transactions: List[Transaction], 
                                  opening_balance: Optional[Decimal] = None) -> List[Transaction]:
         """
@@ -128,17 +175,14 @@ class DataProcessor:
         if not description:
             return ""
         
-        # Remove excessive whitespace
+        # Collapse whitespace runs; split() also drops leading/trailing whitespace
         cleaned = ' '.join(description.split())
         
-        # Remove common artifacts
-        cleaned = cleaned.replace('  ', ' ')
-        
         # Truncate if too long (for CSV compatibility)
         if len(cleaned) > 200:
             cleaned = cleaned[:197] + "..."
         
-        return cleaned.strip()
+        return cleaned
     
     def _clean_merchant_name(self, merchant: str) -> str:
         """Clean up merchant name"""
@@ -153,21 +197,11 @@ class DataProcessor:
         
         return cleaned
     
-    def _validate_amount(self, amount: Decimal) -> bool:
-        """Validate that amount is reasonable"""
-        # Check for extremely large amounts that might be parsing errors
-        if amount > Decimal('50000'):  # $50,000 threshold
-            return False
-        
-        # Check for zero amounts
-        if amount == Decimal('0'):
-            return False
-        
-        # Check for negative amounts (should always be positive)
-        if amount < Decimal('0'):
-            return False
-        
-        return True
+    def _validate_amount(self, amount_cents: int) -> bool:
+        """Validate that amount (in integer cents) is reasonable"""
+        # Zero and negative amounts are invalid (amounts are always positive), as are
+        # extremely large amounts that might be parsing errors
+        return 0 < amount_cents <= MAX_AMOUNT_CENTS
     
     def _validate_transaction_date(self, transaction: Transaction, 
                                  summary: StatementSummary) -> bool:
@@ -192,14 +226,28 @@ class DataProcessor:
         
         return True
     
-    def _validate_balance_calculations(self, transactions: List[Transaction],
+    def _validate_balance_calculations(self, transactions: Union[List[Transaction], TransactionBatch],
                                      summary: StatementSummary) -> bool:
         """Validate that transaction totals match statement summary"""
-        total_credits = sum((t.amount for t in transactions if t.transaction_type == 'CREDIT'), Decimal('0'))
-        total_debits = sum((t.amount for t in transactions if t.transaction_type == 'DEBIT'), Decimal('0'))
-        
-        credit_count = len([t for t in transactions if t.transaction_type == 'CREDIT'])
-        debit_count = len([t for t in transactions if t.transaction_type == 'DEBIT'])
+        # int64 cent columns reduce in C; Decimals are built once at the end
+        if isinstance(transactions, TransactionBatch):
+            amount_cents, type_codes = transactions.amount_cents, transactions.type_code
+        else:
+            # Only the two columns needed here, rather than a full batch
+            count = len(transactions)
+            amount_cents = np.fromiter((t.amount_cents for t in transactions), dtype=np.int64, count=count)
+            type_codes = np.fromiter((TYPE_CODES.get(t.transaction_type, TYPE_OTHER) for t in transactions),
+                                     dtype=np.int8, count=count)
+        
+        is_credit = type_codes == TYPE_CREDIT
+        is_debit = type_codes == TYPE_DEBIT
+        credit_cents = int(amount_cents[is_credit].sum())
+        debit_cents = int(amount_cents[is_debit].sum())
+        credit_count = int(np.count_nonzero(is_credit))
+        debit_count = int(np.count_nonzero(is_debit))
+        
+        total_credits = Decimal(credit_cents).scaleb(-2)
+        total_debits = Decimal(debit_cents).scaleb(-2)
         
         # Update summary with calculated totals
         summary.total_deposits = total_credits
@@ -221,7 +269,7 @@ class DataProcessor:
                 incomplete_count += 1
                 self.warnings.append(f"Empty description for transaction on {transaction.date}")
             
-            if transaction.amount == Decimal('0'):
+            if transaction.amount_cents == 0:
                 incomplete_count += 1
                 self.warnings.append(f"Zero amount for transaction on {transaction.date}")
         
@@ -233,30 +281,32 @@ class DataProcessor:
     def _find_duplicates(self, transactions: List[Transaction]) -> List[List[Transaction]]:
         """Find potential duplicate transactions
 
-        Includes page number, source file, and position to distinguish legitimate
-        same-day, same-amount transactions at the same merchant from true duplicates.
+        Groups on date, amount and merchant, plus page number and source file so that
+        only repeats within the same page of one statement are reported. Each group of
+        two or more transactions is returned once, in list order.
         """
-        duplicates = []
-        seen = {}
+        # A single hashed-tuple scan; building integer key columns for a NumPy lexsort
+        # costs more than the grouping itself when starting from Transaction objects
+        groups = defaultdict(list)
+        # Merchants repeat heavily, so each distinct name is lowercased once
+        merchant_keys = {}
+
+        for transaction in transactions:
+            merchant = transaction.merchant
+            merchant_key = merchant_keys.get(merchant)
+            if merchant_key is None:
+                merchant_key = merchant_keys[merchant] = merchant.lower() if merchant else ""
 
-        for idx, transaction in enumerate(transactions):
-            # Create a key that includes position to handle legitimate same-day duplicates
             key = (
                 transaction.date,
-                transaction.amount,
-                transaction.merchant.lower() if transaction.merchant else "",
+                transaction.amount_cents,
+                merchant_key,
                 transaction.page_number,
-                transaction.source_file,
-                idx  # Position in transaction list as tie-breaker
+                transaction.source_file
             )
+            groups[key].append(transaction)
 
-            if key in seen:
-                # Found potential duplicate
-                duplicates.append([seen[key], transaction])
-            else:
-                seen[key] = transaction
-
-        return duplicates
+        return [group for group in groups.values() if len(group) > 1]
     
     def get_validation_report(self) -> str:
         """Generate validation report with errors and warnings"""
@@ -8,20 +8,44 @@ import sys
 from pathlib import Path
 import re
 
+# Compiled once at import instead of being looked up in re's cache per line
+DATE_PATTERN = re.compile(r'^(\d{1,2}/\d{1,2})\s+')
+AMOUNT_PATTERN = re.compile(r'\b\d+\.\d{2}\b')
+
+# Section bodies: everything after the header line up to the first terminating line
+# (a repeated header line never terminates), sliced out in one scan
+DEPOSITS_HEADER = "Deposits and Other Additions"
+DEPOSITS_SECTION = re.compile(
+    r'Deposits and Other Additions[^\n]*\n(.*?)'
+    r'(?:^(?![^\n]*Deposits and Other Additions)[^\n]*(?:Banking/Debit Card|Checks)|\Z)',
+    re.M | re.S
+)
+WITHDRAWALS_HEADER = "Banking/Debit Card Withdrawals"
+WITHDRAWALS_SECTION = re.compile(
+    r'Banking/Debit Card Withdrawals[^\n]*\n(.*?)'
+    r'(?:^(?![^\n]*Banking/Debit Card Withdrawals)[^\n]*(?i:continued on next page)|\Z)',
+    re.M | re.S
+)
+
+
+def section_lines(pattern, header, text):
+    """Non-blank lines of the first section matched by pattern, skipping repeated header lines"""
+    match = pattern.search(text)
+    if not match:
+        return []
+    return [line for line in match.group(1).split('\n') if line.strip() and header not in line]
+
 def analyze_transactions(pdf_path):
     """Deep dive into transaction structure"""
     print(f"Detailed Transaction Analysis: {pdf_path}")
     print("=" * 80)
     
     with pdfplumber.open(pdf_path) as pdf:
-        all_text = ""
-        
-        # Extract text from all pages
+        # Each page is analyzed on its own; nothing needs the whole document's text
         for page_num, page in enumerate(pdf.pages, 1):
             page_text = page.extract_text()
             if page_text:
                 print(f"\n--- PAGE {page_num} ---")
-                all_text += page_text + "\n"
                 
                 # Look for transaction sections on this page
                 if "Activity Detail" in page_text:
@@ -42,21 +66,7 @@ def extract_deposits_section(text):
     print("\nDEPOSITS SECTION ANALYSIS:")
     print("-" * 40)
     
-    lines = text.split('\n')
-    in_deposits = False
-    deposit_lines = []
-    
-    for line in lines:
-        if "Deposits and Other Additions" in line:
-            in_deposits = True
-            continue
-        elif in_deposits and ("Banking/Debit Card" in line or "Checks" in line or line.strip() == ""):
-            if line.strip() == "":
-                continue
-            else:
-                break
-        elif in_deposits:
-            deposit_lines.append(line)
+    deposit_lines = section_lines(DEPOSITS_SECTION, DEPOSITS_HEADER, text)
     
     print(f"Found {len(deposit_lines)} lines in deposits section:")
     for i, line in enumerate(deposit_lines, 1):
@@ -71,20 +81,7 @@ def extract_withdrawals_section(text):
     print("\nWITHDRAWALS SECTION ANALYSIS:")
     print("-" * 40)
     
-    lines = text.split('\n')
-    in_withdrawals = False
-    withdrawal_lines = []
-    
-    for line in lines:
-        if "Banking/Debit Card Withdrawals" in line:
-            in_withdrawals = True
-            continue
-        elif in_withdrawals and (line.strip() == "" or "continued on next page" in line.lower()):
-            if "continued on next page" in line.lower():
-                break
-            continue
-        elif in_withdrawals:
-            withdrawal_lines.append(line)
+    withdrawal_lines = section_lines(WITHDRAWALS_SECTION, WITHDRAWALS_HEADER, text)
     
     print(f"Found {len(withdrawal_lines)} lines in withdrawals section:")
     for i, line in enumerate(withdrawal_lines[:10], 1):  # First 10 only
@@ -99,26 +96,23 @@ def parse_transactions(lines, transaction_type):
     print(f"\nTransaction parsing for {transaction_type}:")
     
     # Look for patterns like: MM/DD  AMOUNT  DESCRIPTION
-    date_pattern = r'^(\d{1,2}/\d{1,2})\s+'
-    amount_pattern = r'(\d+\.\d{2})\s+'
-    
     for line in lines:
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped:
             continue
             
         # Try to match date at start of line
-        date_match = re.match(date_pattern, line.strip())
+        date_match = DATE_PATTERN.match(stripped)
         if date_match:
-            print(f"  Date found: {date_match.group(1)} | Full line: '{line.strip()}'")
+            print(f"  Date found: {date_match.group(1)} | Full line: '{stripped}'")
             
             # Try to extract amount (look for decimal patterns)
-            amounts = re.findall(r'\b\d+\.\d{2}\b', line)
+            amounts = AMOUNT_PATTERN.findall(line)
             if amounts:
                 print(f"    Amounts found: {amounts}")
         else:
             # Might be a continuation line or description
-            if len(line.strip()) > 0:
-                print(f"  Non-date line: '{line.strip()}'")
+            print(f"  Non-date line: '{stripped}'")
 
 def main():
     if len(sys.argv) != 2:
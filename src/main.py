@@ -2,8 +2,14 @@
 
 import click
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import groupby, repeat
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 import sys
 
 try:
@@ -11,22 +17,136 @@ try:
     from .parsers import PNCStatementParser, BBVAStatementParser
     from .data_processor import DataProcessor
     from .csv_exporter import CSVExporter
-    from .year_processor import YearProcessor
+    from .year_processor import YearProcessor, iter_pdf_files
 except ImportError:
     from pdf_ingester import PDFIngester
     from parsers import PNCStatementParser, BBVAStatementParser
     from data_processor import DataProcessor
     from csv_exporter import CSVExporter
-    from year_processor import YearProcessor
+    from year_processor import YearProcessor, iter_pdf_files
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging; timestamps (a localtime + strftime per record) are only formatted with --verbose
+LOG_FORMAT = '%(name)s - %(levelname)s - %(message)s'
+VERBOSE_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
+# No handler formats thread or process fields, so skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logger = logging.getLogger(__name__)
 
 
+# Components are built once per process (including each pool worker) so
+# categories.json is read and the parsers' patterns compiled only once
+@lru_cache(maxsize=1)
+def _get_ingester() -> PDFIngester:
+    return PDFIngester()
+
+
+@lru_cache(maxsize=1)
+def _get_parsers() -> Dict[str, object]:
+    return {
+        'PNC_VIRTUAL_WALLET': PNCStatementParser(),
+        'BBVA_LEGACY': BBVAStatementParser(),
+    }
+
+
+def _process_one_pdf(pdf_file: Path, detect_duplicates: bool = False,
+                     validate_only: bool = False) -> Tuple[list, Optional[object], List[Tuple[str, bool]], List[str], List[str]]:
+    """
+    Extract, parse, clean and validate a single statement.
+    With validate_only, the transactions are still checked but not returned.
+    Lives at module level so ProcessPoolExecutor can pickle it for worker processes.
+    Console messages are returned as (text, err) pairs so the caller prints them in file order.
+    Returns (transactions, summary, messages, validation_errors, warnings).
+    """
+    ingester = _get_ingester()
+    parsers_by_type = _get_parsers()
+    # DataProcessor accumulates validation errors/warnings, so it stays per-file
+    processor = DataProcessor()
+    messages = [(f"Processing: {pdf_file.name}", False)]
+
+    def result(transactions=(), statement_summary=None):
+        return list(transactions), statement_summary, messages, processor.validation_errors, processor.warnings
+
+    # Extract text
+    pages_text = ingester.extract_text_content(pdf_file)
+    if not pages_text:
+        messages.append((f"Warning: No text extracted from {pdf_file.name}", True))
+        return result()
+
+    # Identify statement type
+    statement_type = ingester.identify_statement_type(pages_text)
+    if statement_type == 'BBVA_LEGACY':
+        messages.append((f"Detected BBVA legacy statement: {pdf_file.name}", False))
+    elif statement_type != 'PNC_VIRTUAL_WALLET':
+        messages.append((f"Warning: {pdf_file.name} format not recognized; attempting PNC parser", True))
+
+    parser = parsers_by_type.get(statement_type, parsers_by_type['PNC_VIRTUAL_WALLET'])
+
+    # Combine pages
+    combined_text = ingester.handle_multi_page_documents(pages_text)
+
+    # Parse the header once and reuse it for transaction extraction
+    transactions, statement_summary = parser.parse_all(combined_text, source_file=pdf_file.name)
+    if not transactions:
+        messages.append((f"Warning: No transactions found in {pdf_file.name}", True))
+        return result()
+
+    # Clean and validate
+    cleaned_transactions = processor.clean_transaction_data(transactions)
+
+    if statement_summary:
+        is_valid = processor.validate_data_integrity(cleaned_transactions, statement_summary)
+        if not is_valid:
+            messages.append((f"Warning: Validation issues found in {pdf_file.name}", False))
+
+    # Handle duplicates only if flag is enabled
+    if detect_duplicates:
+        final_transactions = processor.handle_duplicate_transactions(cleaned_transactions)
+    else:
+        final_transactions = cleaned_transactions
+
+    messages.append((f"  Extracted {len(final_transactions)} transactions", False))
+    # Validate-only runs discard the rows, so don't pickle them back to the parent
+    return result(() if validate_only else final_transactions, statement_summary)
+
+
+def _init_worker_logging(log_queue, level: int) -> None:
+    """Pool initializer: send this worker's log records to the parent process"""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(log_queue)]
+    root.setLevel(level)
+
+
+def _iter_processed_pdfs(pdf_files: List[Path], detect_duplicates: bool, jobs: int,
+                         validate_only: bool = False):
+    """Yield _process_one_pdf results in file order, fanning out to a process pool for multi-file runs"""
+    workers = min(jobs, len(pdf_files))
+    if workers < 2:
+        # Pool start-up costs more than it saves for a single statement
+        for pdf_file in pdf_files:
+            yield _process_one_pdf(pdf_file, detect_duplicates, validate_only)
+        return
+
+    # Workers log through a queue that the parent drains into its own handlers,
+    # so records from different processes never contend for (or interleave on) stderr
+    root = logging.getLogger()
+    log_queue = multiprocessing.Queue()
+    listener = QueueListener(log_queue, *root.handlers)
+    listener.start()
+    try:
+        # Each worker builds its own ingester/parsers; results come back in submission order
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker_logging,
+                                 initargs=(log_queue, root.level)) as executor:
+            yield from executor.map(_process_one_pdf, pdf_files, repeat(detect_duplicates),
+                                    repeat(validate_only))
+    finally:
+        listener.stop()
+
+
 @click.command()
 @click.option('--file', '-f', type=click.Path(exists=True, path_type=Path), 
               help='Single PDF statement file to process')
@@ -50,7 +170,9 @@ logger = logging.getLogger(__name__)
               help='Only validate files without generating output')
 @click.option('--detect-duplicates', is_flag=True,
               help='Enable duplicate transaction detection (disabled by default)')
-def main(file, directory, year, base_path, include_next_month, output, monthly, summary, verbose, validate_only, detect_duplicates):
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Worker processes for multi-file runs (default: CPU count; 1 processes files serially)')
+def main(file, directory, year, base_path, include_next_month, output, monthly, summary, verbose, validate_only, detect_duplicates, jobs):
     """
     PNC Statement Parser - Convert PNC bank statement PDFs to CSV format.
     
@@ -73,6 +195,7 @@ def main(file, directory, year, base_path, include_next_month, output, monthly,
     
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
+        _log_handler.setFormatter(logging.Formatter(VERBOSE_LOG_FORMAT))
     
     # Validate arguments
     input_modes = sum(bool(x) for x in [file, directory, year])
@@ -86,11 +209,6 @@ def main(file, directory, year, base_path, include_next_month, output, monthly,
     
     try:
         # Initialize components
-        ingester = PDFIngester()
-        parsers_by_type = {
-            'PNC_VIRTUAL_WALLET': PNCStatementParser(),
-            'BBVA_LEGACY': BBVAStatementParser(),
-        }
         processor = DataProcessor()
         exporter = CSVExporter()
         
@@ -101,7 +219,7 @@ def main(file, directory, year, base_path, include_next_month, output, monthly,
         if file:
             pdf_files = [file]
         elif directory:
-            pdf_files = list(directory.glob("*.pdf"))
+            pdf_files = list(iter_pdf_files(directory))
             if not pdf_files:
                 click.echo(f"No PDF files found in {directory}", err=True)
                 sys.exit(1)
@@ -127,61 +245,31 @@ def main(file, directory, year, base_path, include_next_month, output, monthly,
         
         all_transactions = []
         all_summaries = []
+        pre_filter_count = 0
         
-        # Process each file
-        for pdf_file in pdf_files:
-            click.echo(f"Processing: {pdf_file.name}")
-            
-            # Extract text
-            pages_text = ingester.extract_text_content(pdf_file)
-            if not pages_text:
-                click.echo(f"Warning: No text extracted from {pdf_file.name}", err=True)
-                continue
-            
-            # Identify statement type
-            statement_type = ingester.identify_statement_type(pages_text)
-            if statement_type == 'BBVA_LEGACY':
-                click.echo(f"Detected BBVA legacy statement: {pdf_file.name}")
-            elif statement_type != 'PNC_VIRTUAL_WALLET':
-                click.echo(f"Warning: {pdf_file.name} format not recognized; attempting PNC parser", err=True)
-            
-            parser = parsers_by_type.get(statement_type, parsers_by_type['PNC_VIRTUAL_WALLET'])
-            
-            # Combine pages
-            combined_text = ingester.handle_multi_page_documents(pages_text)
+        # Process each file (in parallel for multi-file runs); output stays in file order.
+        # Only rows that will be exported are kept: year filtering happens per file as
+        # results arrive, and validate-only runs keep none
+        for transactions, statement_summary, messages, errors, warnings in _iter_processed_pdfs(
+                pdf_files, detect_duplicates, jobs or os.cpu_count() or 1, validate_only):
+            # One write per run of same-stream messages rather than one per line
+            for err, run in groupby(messages, key=lambda message: message[1]):
+                click.echo('\n'.join(message for message, _ in run), err=err)
+            processor.validation_errors.extend(errors)
+            processor.warnings.extend(warnings)
 
-            # Parse transactions
-            transactions = parser.extract_transaction_data(combined_text, source_file=pdf_file.name)
-            if not transactions:
-                click.echo(f"Warning: No transactions found in {pdf_file.name}", err=True)
-                continue
-            
-            # Parse summary info
-            statement_summary = parser.parse_account_info(combined_text)
             if statement_summary:
                 all_summaries.append(statement_summary)
+            if validate_only:
+                continue
             
-            # Clean and validate
-            cleaned_transactions = processor.clean_transaction_data(transactions)
-
-            if statement_summary:
-                is_valid = processor.validate_data_integrity(cleaned_transactions, statement_summary)
-                if not is_valid:
-                    click.echo(f"Warning: Validation issues found in {pdf_file.name}")
-
-            # Handle duplicates only if flag is enabled
-            if detect_duplicates:
-                final_transactions = processor.handle_duplicate_transactions(cleaned_transactions)
-            else:
-                final_transactions = cleaned_transactions
-
-            all_transactions.extend(final_transactions)
-            click.echo(f"  Extracted {len(final_transactions)} transactions")
+            pre_filter_count += len(transactions)
+            if year_mode and year:
+                transactions = year_processor.filter_transactions_by_year(transactions, year)
+            all_transactions.extend(transactions)
         
-        # Apply year filtering if in year mode
+        # Report year filtering if in year mode
         if year_mode and year:
-            pre_filter_count = len(all_transactions)
-            all_transactions = year_processor.filter_transactions_by_year(all_transactions, year)
             post_filter_count = len(all_transactions)
             if pre_filter_count != post_filter_count:
                 click.echo(f"Filtered to {post_filter_count} transactions for year {year} "
@@ -1,10 +1,21 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from decimal import Decimal
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
+import numpy as np
 
-@dataclass
+# Slotted instances drop the per-object __dict__; dataclass(slots=...) needs 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _intern(value):
+    """sys.intern for exact str values; anything else (e.g. None) is returned unchanged"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(**_SLOTS)
 class Transaction:
     """
     Data model for a single transaction from PNC statement.
@@ -19,25 +30,48 @@ class Transaction:
     merchant: str          # Extracted merchant name
     card_last_four: str    # Card reference (e.g., "3767")
     category: str          # Auto-categorized type
-    raw_lines: List[str]   # Original text lines for debugging
+    raw_lines: Sequence[str]  # Original text lines for debugging (stored as a tuple)
     page_number: int       # Source page
     source_file: str = ""  # Source PDF filename
+    # Integer cents derived from amount once at construction; hot comparisons and totals use this
+    amount_cents: int = field(init=False, repr=False, compare=False)
+    # -1 for debits, +1 otherwise; fixed at construction like amount_cents
+    _sign: int = field(init=False, repr=False, compare=False)
+    # Memoized by full_date; excluded from the constructor and equality
+    _full_date: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Low-cardinality fields repeat across a year of statements; share one string each
+        self.date = _intern(self.date)
+        self.transaction_type = _intern(self.transaction_type)
+        self.merchant = _intern(self.merchant)
+        self.card_last_four = _intern(self.card_last_four)
+        self.category = _intern(self.category)
+        self.source_file = _intern(self.source_file)
+        self.raw_lines = tuple(self.raw_lines)
+        self.amount_cents = int(self.amount.scaleb(2).to_integral_value())
+        self._sign = -1 if self.transaction_type == 'DEBIT' else 1
 
     @property
     def full_date(self) -> datetime:
         """Convert MM/DD date to full datetime using statement year/month"""
-        month, day = map(int, self.date.split('/'))
-        return datetime(self.year, month, day)
+        if self._full_date is None:
+            month, day = map(int, self.date.split('/'))
+            self._full_date = datetime(self.year, month, day)
+        return self._full_date
     
     @property
     def signed_amount(self) -> Decimal:
         """Return amount with correct sign based on transaction type"""
-        if self.transaction_type == 'DEBIT':
-            return -self.amount
-        return self.amount
+        return -self.amount if self._sign < 0 else self.amount
+    
+    @property
+    def signed_cents(self) -> int:
+        """Signed amount in integer cents (negative for debits)"""
+        return self._sign * self.amount_cents
 
 
-@dataclass  
+@dataclass(**_SLOTS)
 class StatementSummary:
     """Summary information extracted from PNC statement header"""
     account_number: str
@@ -47,4 +81,83 @@ class StatementSummary:
     total_deposits: Decimal
     total_withdrawals: Decimal
     deposit_count: int
-    withdrawal_count: int
\ No newline at end of file
+    withdrawal_count: int
+
+
+# Amounts above this many cents ($50,000) are flagged as likely parsing errors
+MAX_AMOUNT_CENTS = 5_000_000
+
+# TransactionBatch.type_code values
+TYPE_CREDIT = 0
+TYPE_DEBIT = 1
+TYPE_OTHER = -1
+TYPE_CODES = {'CREDIT': TYPE_CREDIT, 'DEBIT': TYPE_DEBIT}
+
+
+@dataclass
+class TransactionBatch:
+    """
+    Column-oriented (structure of arrays) form of a list of transactions.
+    Amounts are int64 cents so totals are vectorized NumPy reductions.
+    """
+    date: np.ndarray            # YYYY-MM-DD strings
+    year: np.ndarray            # int
+    month: np.ndarray           # int
+    amount_cents: np.ndarray    # int64, always positive
+    type_code: np.ndarray       # int8: TYPE_CREDIT / TYPE_DEBIT / TYPE_OTHER
+    transaction_type: np.ndarray
+    description: np.ndarray
+    merchant: np.ndarray
+    card_last_four: np.ndarray
+    category: np.ndarray
+    source_file: np.ndarray
+    page_number: np.ndarray
+
+    @classmethod
+    def from_transactions(cls, transactions: List[Transaction]) -> 'TransactionBatch':
+        """Build a batch from Transaction objects (for callers still producing lists)"""
+        def objects(values) -> np.ndarray:
+            column = np.empty(len(transactions), dtype=object)
+            column[:] = values
+            return column
+
+        types = [t.transaction_type for t in transactions]
+        return cls(
+            date=objects([t.full_date.strftime('%Y-%m-%d') for t in transactions]),
+            year=np.array([t.year for t in transactions], dtype=np.int64),
+            month=np.array([t.month for t in transactions], dtype=np.int64),
+            amount_cents=np.array([t.amount_cents for t in transactions], dtype=np.int64),
+            type_code=np.array([TYPE_CODES.get(t, TYPE_OTHER) for t in types], dtype=np.int8),
+            transaction_type=objects(types),
+            description=objects([t.description for t in transactions]),
+            merchant=objects([t.merchant for t in transactions]),
+            card_last_four=objects([t.card_last_four for t in transactions]),
+            category=objects([t.category for t in transactions]),
+            source_file=objects([t.source_file for t in transactions]),
+            page_number=np.array([t.page_number for t in transactions], dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+
+    @property
+    def signed_cents(self) -> np.ndarray:
+        """Amounts in cents, negative for debits"""
+        return np.where(self.type_code == TYPE_DEBIT, -self.amount_cents, self.amount_cents)
+
+    @property
+    def signed_amounts(self) -> np.ndarray:
+        """float64 dollar amounts, negative for debits, converted in one vectorized pass"""
+        return self.signed_cents / 100
+
+    def total_cents(self, type_code: int) -> int:
+        """Sum of amount_cents for one transaction type"""
+        return int(self.amount_cents[self.type_code == type_code].sum())
+
+    def count(self, type_code: int) -> int:
+        """Number of transactions of one type"""
+        return int(np.count_nonzero(self.type_code == type_code))
+
+    def take(self, indices: np.ndarray) -> 'TransactionBatch':
+        """New batch with rows selected (and ordered) by indices or a boolean mask"""
+        return TransactionBatch(**{name: column[indices] for name, column in vars(self).items()})
@@ -1,5 +1,10 @@
 import re
-from typing import List
+from typing import List, Tuple
+
+try:
+    from .regex_engine import compile_pattern
+except ImportError:
+    from regex_engine import compile_pattern
 
 
 class BBVAPatterns:
@@ -12,12 +17,12 @@ class BBVAPatterns:
         # ===== DATE PATTERN =====
         # BBVA uses M/D or MM/DD format (no year in transaction lines)
         # Example: "9/27", "8/31", "10/1"
-        self.DATE_PATTERN = re.compile(r'^(\d{1,2}/\d{1,2})\s+')
+        self.DATE_PATTERN = compile_pattern(r'^(\d{1,2}/\d{1,2})\s+')
 
         # ===== AMOUNT PATTERN =====
         # BBVA includes dollar sign: $22.63, $1,347.42
         # Captures: $123.45 → "123.45"
-        self.AMOUNT_PATTERN = re.compile(r'\$(\d{1,3}(?:,\d{3})*\.\d{2})')
+        self.AMOUNT_PATTERN = compile_pattern(r'\$(\d{1,3}(?:,\d{3})*\.\d{2})')
 
         # ===== TRANSACTION TYPE PATTERNS =====
         # BBVA-specific transaction identifiers
@@ -39,6 +44,12 @@ class BBVAPatterns:
             re.IGNORECASE
         )
 
+        # Masked card anywhere in a transaction: a run of 2+ X's then 4 digits, tolerating
+        # spaces anywhere in it (PyPDF2 splits these). Captures digits possibly with spaces
+        self.MASKED_CARD_PATTERN = re.compile(r'X(?: *X)+ *(\d(?: *\d){3})')
+        # Fallback "#1234" / "#123" card or store reference
+        self.CARD_HASH_PATTERN = re.compile(r'#(\d{3,4})')
+
         # ===== SERIAL NUMBER PATTERN =====
         # Format: "VISA 8400360008/31/21"
         # Groups: (1) network, (2) serial, (3) date
@@ -59,8 +70,9 @@ class BBVAPatterns:
         # or "Beginning September 2,2021-EndingOctober1,2021" (PyPDF2 variant without spaces)
         # Groups: (1) start month, (2) start day, (3) start year,
         #         (4) end month, (5) end day, (6) end year
+        # The optional dash owns its trailing whitespace so the two \s* runs can't trade spaces
         self.PERIOD_PATTERN = re.compile(
-            r'Beginning\s*([A-Za-z]+)\s*(\d{1,2}),?\s*(\d{4})\s*-?\s*Ending\s*([A-Za-z]+)\s*(\d{1,2}),?\s*(\d{4})',
+            r'Beginning\s*([A-Za-z]+)\s*(\d{1,2}),?\s*(\d{4})\s*(?:-\s*)?Ending\s*([A-Za-z]+)\s*(\d{1,2}),?\s*(\d{4})',
             re.IGNORECASE
         )
 
@@ -94,10 +106,31 @@ class BBVAPatterns:
             'Calculation of Interest',
             'In esaC of srorrE',  # Mirrored text sometimes
         ]
+        # Upper-cased with spaces removed, for one str.startswith(tuple) check per line
+        self.STOP_PREFIXES = tuple(pattern.replace(' ', '').upper() for pattern in self.STOP_PATTERNS)
 
         # ===== IGNORE PATTERNS =====
         # Compiled regex patterns for lines to skip
         self.IGNORE_PATTERNS = self._build_ignore_patterns()
+        # The same patterns fused into one alternation, so a line is tested in a single match()
+        self.IGNORE_RE = self._fuse_patterns(self.IGNORE_PATTERNS)
+
+        # Description contamination patterns, compiled once rather than per re.sub call
+        self.CONTAMINATION_PATTERNS = tuple(
+            compile_pattern(pattern, ignore_case=True) for pattern in self._contamination_pattern_sources()
+        )
+
+    @staticmethod
+    def _fuse_patterns(patterns: List[re.Pattern]):
+        """
+        Combine patterns into one case-insensitive alternation.
+        Patterns compiled without IGNORECASE contain no letters, so the shared flag doesn't change them.
+        """
+        return compile_pattern('|'.join(f'(?:{pattern.pattern})' for pattern in patterns), ignore_case=True)
+
+    def is_ignored(self, line: str) -> bool:
+        """True if line matches any ignore pattern"""
+        return self.IGNORE_RE.match(line) is not None
 
     def _build_ignore_patterns(self) -> List[re.Pattern]:
         """Build list of patterns for filtering extraneous text"""
@@ -147,8 +180,12 @@ class BBVAPatterns:
             re.compile(r'^\s*$'),
         ]
 
-    def get_contamination_patterns(self) -> List[str]:
-        """Get patterns for cleaning contaminated transaction descriptions"""
+    def get_contamination_patterns(self) -> Tuple:
+        """Get compiled (case-insensitive) patterns for cleaning contaminated transaction descriptions"""
+        return self.CONTAMINATION_PATTERNS
+
+    def _contamination_pattern_sources(self) -> List[str]:
+        """Regex sources for the contamination patterns"""
         return [
             # Header contamination (with or without spaces - PyPDF2 variant)
             r'Date\s*\*\s*Serial\s*#\s*Description.*',
@@ -1,8 +1,6 @@
 import logging
-import re
-from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, Set, Tuple
+from typing import List, Optional, Tuple
 
 try:
     from ..models import Transaction, StatementSummary
@@ -69,8 +67,10 @@ class BBVAStatementParser(BaseStatementParser):
             logger.error(f"Failed to parse BBVA account info: {exc}")
             return None
 
-    def extract_transaction_data(self, text: str, source_file: str = "") -> List[Transaction]:
-        summary = self.parse_account_info(text)
+    def extract_transaction_data(self, text: str, source_file: str = "",
+                                 summary: Optional[StatementSummary] = None) -> List[Transaction]:
+        if summary is None:
+            summary = self.parse_account_info(text)
         if not summary:
             logger.error("BBVA parser could not parse header; aborting transactions")
             return []
@@ -81,13 +81,14 @@ class BBVAStatementParser(BaseStatementParser):
 
     def _extract_legacy_transactions(self, text: str, summary: StatementSummary, source_file: str = "") -> List[Transaction]:
         transactions: List[Transaction] = []
-        seen_keys: Set[Tuple[str, str, str, int]] = set()
 
-        lines = text.split('\n')
+        # splitlines() also handles '\r\n' and '\r' endings, so raw_lines never keep a trailing '\r'
+        lines = text.splitlines()
         current_page = 1
         i = 0
-        # Use BBVA-specific stop patterns from the patterns class
-        summary_stop_prefixes = self.patterns.STOP_PATTERNS
+        # Use BBVA-specific stop patterns from the patterns class, pre-normalized
+        summary_stop_prefixes = self.patterns.STOP_PREFIXES
+        month_to_year = self._month_to_year(summary)
 
         while i < len(lines):
             raw_line = lines[i]
@@ -122,8 +123,8 @@ class BBVAStatementParser(BaseStatementParser):
                     continue
                 if lookahead.startswith('--- PAGE') or self.patterns.DATE_PATTERN.match(lookahead):
                     break
-                normalized = re.sub(r'\s+', '', lookahead.upper())
-                if any(normalized.startswith(prefix.replace(' ', '').upper()) for prefix in summary_stop_prefixes):
+                normalized = ''.join(lookahead.upper().split())
+                if normalized.startswith(summary_stop_prefixes):
                     break
                 raw_lines.append(lookahead_raw)
                 combined += ' ' + lookahead
@@ -137,25 +138,23 @@ class BBVAStatementParser(BaseStatementParser):
             transaction_amount_str, balance_amount_str = self._split_amounts(amounts)
             transaction_amount = Decimal(transaction_amount_str.replace(',', ''))
 
-            description_portion = re.sub(r'^' + re.escape(date_fragment), '', combined, count=1).strip()
+            # DATE_PATTERN matched at the start of the line, so the date is a plain prefix
+            description_portion = combined[len(date_fragment):] if combined.startswith(date_fragment) else combined
+            description_portion = description_portion.strip()
             description_portion = self._remove_amount_from_text(description_portion, transaction_amount_str)
             if balance_amount_str:
                 description_portion = self._remove_amount_from_text(description_portion, balance_amount_str)
-            description_portion = re.sub(r'\s+', ' ', description_portion).strip()
+            # Collapse whitespace runs; split() also drops leading/trailing whitespace
+            description_portion = ' '.join(description_portion.split())
 
             transaction_type = self._infer_transaction_type(description_portion)
             normalized_date = self._normalize_date(date_fragment)
-            transaction_year = self._infer_year(normalized_date, summary)
             month = int(normalized_date.split('/')[0])
+            transaction_year = month_to_year[month]
 
             card_last_four = self._extract_card_last_four(combined)
-            # Include line position to distinguish legitimate same-day, same-amount transactions
-            key = (normalized_date, transaction_amount_str, description_portion.upper(), i)
-            if key in seen_keys:
-                i = j
-                continue
-            seen_keys.add(key)
-
+            # No dedupe here: identical same-day, same-amount lines are legitimate separate
+            # transactions, and each starts on its own line so it is only visited once
             transaction = Transaction(
                 date=normalized_date,
                 year=transaction_year,
@@ -176,21 +175,28 @@ class BBVAStatementParser(BaseStatementParser):
         return transactions
 
     def _split_amounts(self, amounts: List[str]) -> Tuple[str, Optional[str]]:
+        # The last two amounts are the transaction and running balance. findall() is kept:
+        # for these short strings it beats a finditer() scan that retains only two matches
         if len(amounts) == 1:
             return amounts[0], None
 
-        cleaned = [amt for amt in amounts]
-        transaction_amount = cleaned[-2] if len(cleaned) >= 2 else cleaned[0]
-        balance_amount = cleaned[-1]
-
-        if transaction_amount == balance_amount and len(cleaned) == 2:
+        transaction_amount, balance_amount = amounts[-2], amounts[-1]
+        if transaction_amount == balance_amount and len(amounts) == 2:
             balance_amount = None
 
         return transaction_amount, balance_amount
 
     def _remove_amount_from_text(self, text: str, amount_str: str) -> str:
-        pattern = r'(?:\$\s*)?' + re.escape(amount_str)
-        return re.sub(pattern, '', text, count=1).strip()
+        # Remove the first occurrence of amount_str along with a '$' (and any whitespace)
+        # directly before it; plain string ops, no per-call regex compile
+        index = text.find(amount_str)
+        if index < 0:
+            return text.strip()
+        before = text[:index]
+        prefix = before.rstrip()
+        if prefix.endswith('$'):
+            before = prefix[:-1]
+        return (before + text[index + len(amount_str):]).strip()
 
     def _infer_transaction_type(self, description: str) -> str:
         upper = description.upper()
@@ -203,33 +209,24 @@ class BBVAStatementParser(BaseStatementParser):
         month, day = date_fragment.split('/')
         return f"{int(month):02d}/{int(day):02d}"
 
-    def _infer_year(self, date_str: str, summary: StatementSummary) -> int:
-        month = int(date_str.split('/')[0])
+    def _month_to_year(self, summary: StatementSummary) -> List[int]:
+        """
+        Year for every month number DATE_PATTERN can capture (0-99), computed once per statement.
+        Months on or after the period's start month belong to the start year when the period
+        crosses a year boundary.
+        """
         start = summary.statement_period_start
         end = summary.statement_period_end
-
         if start.year == end.year:
-            return start.year
-
-        if month >= start.month:
-            return start.year
-        return end.year
-
-    def _parse_month_day_year(self, month_str: str, day_str: str, year_str: str) -> datetime:
-        month_str = month_str.strip()
-        day = int(day_str)
-        year = int(year_str)
-
-        try:
-            return datetime.strptime(f"{month_str} {day} {year}", '%B %d %Y')
-        except ValueError:
-            return datetime.strptime(f"{month_str} {day} {year}", '%b %d %Y')
+            return [start.year] * 100
+        return [start.year if month >= start.month else end.year for month in range(100)]
 
     def _extract_card_last_four(self, text: str) -> str:
-        candidate = re.search(r'X{2,}(\d{4})', text.replace(' ', ''))
+        # Matches the masked card in place rather than on a space-stripped copy of text
+        candidate = self.patterns.MASKED_CARD_PATTERN.search(text)
         if candidate:
-            return candidate.group(1)
-        candidate = re.search(r'#(\d{3,4})', text)
+            return candidate.group(1).replace(' ', '')
+        candidate = self.patterns.CARD_HASH_PATTERN.search(text)
         if candidate:
             return candidate.group(1)[-4:]
         return ''
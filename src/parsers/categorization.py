@@ -1,11 +1,40 @@
+import copy
 import json
 import logging
+import os
 import re
+from functools import lru_cache
 from pathlib import Path as FilePath
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Pattern, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from .regex_engine import compile_pattern
+except ImportError:
+    from regex_engine import compile_pattern
 
 logger = logging.getLogger(__name__)
 
+# Results are cached on the exact description. Normalized keys (digits folded, prefixes) would
+# conflate descriptions that patterns such as 'BP#\d+' or late-position merchants tell apart.
+CATEGORY_CACHE_SIZE = 8192
+
+# Patterns without these characters are plain substrings and can go in the Aho-Corasick automaton
+REGEX_METACHARS = re.compile(r'[.*+?^$()\[\]{}|\\]')
+
+# (automaton over upper-cased literals -> category index, per-category regexes for the remaining
+# patterns, category names by index)
+LiteralMatcher = Tuple[Any, List[Tuple[int, List[Pattern]]], List[str]]
+
 
 class TransactionCategorizer:
     """
@@ -13,43 +42,158 @@ class TransactionCategorizer:
     Supports regex pattern matching for flexible transaction classification.
     """
     
+    # Parsed categories and compiled patterns shared by every categorizer loading the same
+    # file, keyed by resolved path and mtime so edits to the file are picked up
+    _FILE_CACHE: Dict[Tuple[str, int], Tuple[Dict[str, Any], List[Tuple[str, List[Pattern]]],
+                                              Optional[LiteralMatcher]]] = {}
+    
     def __init__(self, categories_file: Optional[str] = None):
-        self.categories = self._load_categories(categories_file)
+        cache_key = self._file_cache_key(categories_file)
+        cached = self._FILE_CACHE.get(cache_key) if cache_key else None
+        if cached is None:
+            categories = self._load_categories(categories_file)
+            cached = (categories, self._compile_categories(categories),
+                      self._build_literal_matcher(categories))
+            if cache_key:
+                self._FILE_CACHE[cache_key] = cached
+        # Instances may edit their categories (add_category), so each gets its own copy;
+        # the compiled list is replaced rather than mutated, so it can be shared
+        self.categories = copy.deepcopy(cached[0])
+        self._compiled = cached[1]
+        self._literal_matcher = cached[2]
+        self._reset_cache()
     
     def categorize_transaction(self, description: str) -> str:
         """Auto-categorize transaction based on configurable JSON patterns"""
-        desc_upper = description.upper()
+        return self._categorize_cached(description)
+    
+    def _reset_cache(self) -> None:
+        """(Re)create the per-instance result cache, keyed on the exact description"""
+        self._categorize_cached = lru_cache(maxsize=CATEGORY_CACHE_SIZE)(self._categorize_uncached)
+    
+    def _categorize_uncached(self, description: str) -> str:
+        """Match description against the compiled patterns"""
+        # Upper-casing only agrees with re.IGNORECASE for ASCII text
+        if self._literal_matcher is not None and description.isascii():
+            return self._categorize_with_automaton(description)
         
-        # Check each category's patterns
-        for category_name, category_data in self.categories.items():
-            patterns = category_data.get('patterns', [])
-            
-            for pattern in patterns:
-                # Use regex pattern matching for more flexible matching
-                try:
-                    if re.search(pattern.upper(), desc_upper):
-                        logger.debug(f"Categorized '{description[:50]}...' as '{category_name}' (matched: {pattern})")
-                        return category_name
-                except re.error:
-                    # If regex pattern is invalid, fall back to simple string matching
-                    if pattern.upper() in desc_upper:
-                        logger.debug(f"Categorized '{description[:50]}...' as '{category_name}' (simple match: {pattern})")
-                        return category_name
+        # Categories are checked in file order, so earlier categories take priority.
+        # One regex with a named group per category can't replace this loop: search() returns
+        # the leftmost match, not the highest-priority category, and the lookahead form that
+        # keeps priority measured slower than these per-category alternations.
+        for category_name, regexes in self._compiled:
+            for compiled in regexes:
+                match = compiled.search(description)
+                if match:
+                    logger.debug(f"Categorized '{description[:50]}...' as '{category_name}' (matched: {match.group(0)!r})")
+                    return category_name
         
         return 'Other'
     
+    def _categorize_with_automaton(self, description: str) -> str:
+        """Find literal hits in one pass, then check regex-only patterns of higher-priority categories"""
+        automaton, regex_patterns, names = self._literal_matcher
+        best = len(names)
+        if automaton is not None:
+            for _, index in automaton.iter(description.upper()):
+                if index < best:
+                    best = index
+        
+        for index, regexes in regex_patterns:
+            if index >= best:
+                break
+            for compiled in regexes:
+                if compiled.search(description):
+                    best = index
+                    break
+        
+        if best == len(names):
+            return 'Other'
+        logger.debug(f"Categorized '{description[:50]}...' as '{names[best]}'")
+        return names[best]
+    
+    def _compile_categories(self, categories: Dict[str, Any]) -> List[Tuple[str, List[Pattern]]]:
+        """Compile each category's patterns once, case-insensitively, into a single alternation"""
+        compiled = []
+        for category_name, category_data in categories.items():
+            sources = self._pattern_sources(category_name, category_data.get('patterns', []))
+            if sources:
+                compiled.append((category_name, self._compile_union(sources)))
+        return compiled
+    
+    def _build_literal_matcher(self, categories: Dict[str, Any]) -> Optional[LiteralMatcher]:
+        """Split patterns into an automaton of ASCII literals and regexes for the rest (needs pyahocorasick)"""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        regex_patterns = []
+        names = list(categories)
+        for index, category_data in enumerate(categories.values()):
+            regex_sources = []
+            for pattern in category_data.get('patterns', []):
+                if pattern and pattern.isascii() and not REGEX_METACHARS.search(pattern):
+                    literal = pattern.upper()
+                    # A literal shared by several categories belongs to the earliest one
+                    automaton.add_word(literal, min(index, automaton.get(literal, index)))
+                else:
+                    regex_sources.append(pattern)
+            sources = self._pattern_sources(names[index], regex_sources)
+            if sources:
+                regex_patterns.append((index, self._compile_union(sources)))
+        
+        if len(automaton):
+            automaton.make_automaton()
+        else:
+            automaton = None
+        return automaton, regex_patterns, names
+    
+    @staticmethod
+    def _pattern_sources(category_name: str, patterns: List[str]) -> List[str]:
+        """Regex sources for patterns, escaping any that are not valid regexes"""
+        sources = []
+        for pattern in patterns:
+            try:
+                re.compile(pattern)
+                sources.append(pattern)
+            except re.error:
+                # If regex pattern is invalid, fall back to simple string matching
+                logger.debug(f"Invalid regex '{pattern}' in category '{category_name}', matching literally")
+                sources.append(re.escape(pattern))
+        return sources
+    
+    @staticmethod
+    def _compile_union(sources: List[str]) -> List[Pattern]:
+        """One case-insensitive alternation of sources, or one regex each if they can't be combined"""
+        try:
+            return [compile_pattern('|'.join(f'(?:{source})' for source in sources), ignore_case=True)]
+        except re.error:
+            # e.g. inline global flags are only valid at the start of a pattern
+            return [compile_pattern(source, ignore_case=True) for source in sources]
+    
+    @staticmethod
+    def _categories_path(categories_file: Optional[str] = None) -> FilePath:
+        """Path of the categories file, defaulting to the bundled categories.json"""
+        if categories_file:
+            return FilePath(categories_file)
+        # Default to categories.json in the same directory as this file
+        return FilePath(__file__).parent.parent / "categories.json"
+    
+    def _file_cache_key(self, categories_file: Optional[str] = None) -> Optional[Tuple[str, int]]:
+        """(resolved path, mtime) cache key, or None if the file can't be stat'ed"""
+        categories_path = self._categories_path(categories_file)
+        try:
+            return str(categories_path.resolve()), os.stat(categories_path).st_mtime_ns
+        except OSError:
+            return None
+    
     def _load_categories(self, categories_file: Optional[str] = None) -> Dict[str, Any]:
         """Load category patterns from JSON file"""
         try:
-            if categories_file:
-                categories_path = FilePath(categories_file)
-            else:
-                # Default to categories.json in the same directory as this file
-                categories_path = FilePath(__file__).parent.parent / "categories.json"
-            
-            with open(categories_path, 'r') as f:
-                data = json.load(f)
-                return data.get('categories', {})
+            categories_path = self._categories_path(categories_file)
+            raw = categories_path.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            return data.get('categories', {})
         except (FileNotFoundError, json.JSONDecodeError) as e:
             logger.warning(f"Could not load categories.json: {e}. Using fallback categories.")
             # Fallback categories if file not found
@@ -63,6 +207,9 @@ class TransactionCategorizer:
     def add_category(self, category_name: str, patterns: list) -> None:
         """Add a new category with patterns"""
         self.categories[category_name] = {"patterns": patterns}
+        self._compiled = self._compile_categories(self.categories)
+        self._literal_matcher = self._build_literal_matcher(self.categories)
+        self._reset_cache()
     
     def get_categories(self) -> Dict[str, Any]:
         """Get all loaded categories"""
@@ -1,5 +1,10 @@
 import re
-from typing import List
+from typing import List, Tuple
+
+try:
+    from .regex_engine import compile_pattern
+except ImportError:
+    from regex_engine import compile_pattern
 
 
 class PNCPatterns:
@@ -10,10 +15,10 @@ class PNCPatterns:
     
     def __init__(self):
         # Date patterns
-        self.DATE_PATTERN = re.compile(r'^(\d{1,2}/\d{1,2})\s+')
+        self.DATE_PATTERN = compile_pattern(r'^(\d{1,2}/\d{1,2})\s+')
         
         # Amount patterns allow optional leading digits to catch values like ".75"
-        self.AMOUNT_PATTERN = re.compile(r'((?:\d{1,3}(?:,\d{3})*)?\.\d{2})')
+        self.AMOUNT_PATTERN = compile_pattern(r'((?:\d{1,3}(?:,\d{3})*)?\.\d{2})')
         self.SIMPLE_AMOUNT = re.compile(r'((?:\d+)?\.\d{2})')
         
         # Transaction type patterns
@@ -29,6 +34,15 @@ class PNCPatterns:
         self.ONLINE_BANKING_START = re.compile(r'Online\s+and\s+Electronic\s+Banking\s+Deductions', re.IGNORECASE)
         self.DAILY_BALANCE_START = re.compile(r'Daily Balance Detail', re.IGNORECASE)
         self.SECTION_END = re.compile(r'(continued on next page|^\s*$)')
+        # All section headings in one alternation; the group name identifies which one matched
+        self.SECTION_HEADINGS = compile_pattern('|'.join(
+            f'(?P<{name}>{pattern.pattern})' for name, pattern in (
+                ('deposits', self.DEPOSITS_START),
+                ('withdrawals', self.WITHDRAWALS_START),
+                ('online_banking', self.ONLINE_BANKING_START),
+                ('daily_balance', self.DAILY_BALANCE_START),
+            )
+        ), ignore_case=True)
         
         # Header patterns
         self.ACCOUNT_PATTERN = re.compile(r'Primary\s*account(?:\s*number)?\s*:\s*([\d\-]+)', re.IGNORECASE)
@@ -41,6 +55,28 @@ class PNCPatterns:
         
         # Extraneous text patterns to ignore/filter out
         self.IGNORE_PATTERNS = self._build_ignore_patterns()
+        # The same patterns fused into one alternation, so a line is tested in a single match()
+        self.IGNORE_RE = self._fuse_patterns(self.IGNORE_PATTERNS)
+    
+        # Description contamination patterns, compiled once rather than per re.sub call.
+        # They stay separate and are applied in order: later patterns (e.g. trailing
+        # 'Withdrawal') match only after earlier ones have trimmed the text, so a single
+        # union sub would leave "... Withdrawal" behind in "... Withdrawal Account Number: 1".
+        self.CONTAMINATION_PATTERNS = tuple(
+            compile_pattern(pattern, ignore_case=True) for pattern in self._contamination_pattern_sources()
+        )
+    
+    @staticmethod
+    def _fuse_patterns(patterns: List[re.Pattern]):
+        """
+        Combine patterns into one case-insensitive alternation.
+        Patterns compiled without IGNORECASE contain no letters, so the shared flag doesn't change them.
+        """
+        return compile_pattern('|'.join(f'(?:{pattern.pattern})' for pattern in patterns), ignore_case=True)
+    
+    def is_ignored(self, line: str) -> bool:
+        """True if line matches any ignore pattern"""
+        return self.IGNORE_RE.match(line) is not None
     
     def _build_ignore_patterns(self) -> List[re.Pattern]:
         """Build list of patterns for filtering extraneous text"""
@@ -84,8 +120,12 @@ class PNCPatterns:
             re.compile(r'.*Para servicio.*TRS.*calls.*', re.IGNORECASE),
         ]
     
-    def get_contamination_patterns(self) -> List[str]:
-        """Get patterns for cleaning contaminated transaction descriptions"""
+    def get_contamination_patterns(self) -> Tuple:
+        """Get compiled (case-insensitive) patterns for cleaning contaminated transaction descriptions"""
+        return self.CONTAMINATION_PATTERNS
+    
+    def _contamination_pattern_sources(self) -> List[str]:
+        """Regex sources for the contamination patterns"""
         return [
             r'PIN There Date Amount Description.*',
             r'Date Amount Description.*',
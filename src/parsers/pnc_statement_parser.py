@@ -48,8 +48,11 @@ class PNCStatementParser(BaseStatementParser):
             # Extract statement period
             period_match = self.patterns.PERIOD_PATTERN.search(text)
             if period_match:
-                start_date = datetime.strptime(period_match.group(1), '%m/%d/%Y')
-                end_date = datetime.strptime(period_match.group(2), '%m/%d/%Y')
+                # PERIOD_PATTERN only captures M/D/YYYY digits, so no strptime is needed
+                start_month, start_day, start_year = period_match.group(1).split('/')
+                end_month, end_day, end_year = period_match.group(2).split('/')
+                start_date = datetime(int(start_year), int(start_month), int(start_day))
+                end_date = datetime(int(end_year), int(end_month), int(end_day))
             else:
                 alt_period_match = self.patterns.ALT_PERIOD_PATTERN.search(text)
                 if alt_period_match:
@@ -86,7 +89,8 @@ class PNCStatementParser(BaseStatementParser):
             logger.error(f"Failed to parse account info: {e}")
             return None
     
-    def extract_transaction_data(self, text: str, source_file: str = "") -> List[Transaction]:
+    def extract_transaction_data(self, text: str, source_file: str = "",
+                                 summary: Optional[StatementSummary] = None) -> List[Transaction]:
         """
         Extract all transactions from statement text.
         Handles deposits, withdrawals, and online banking sections.
@@ -94,21 +98,25 @@ class PNCStatementParser(BaseStatementParser):
         transactions = []
 
         # Parse account info for date context
-        summary = self.parse_account_info(text)
+        if summary is None:
+            summary = self.parse_account_info(text)
         if not summary:
             logger.error("Could not parse statement header - cannot determine year")
             return []
 
+        # Locate all section headings in one pass, shared by the three extractors
+        spans = self.section_extractor.locate_sections(text)
+
         # Extract deposits
-        deposits = self.section_extractor.extract_deposits_section(text, summary, source_file)
+        deposits = self.section_extractor.extract_deposits_section(text, summary, source_file, spans)
         transactions.extend(deposits)
 
         # Extract withdrawals
-        withdrawals = self.section_extractor.extract_withdrawals_section(text, summary, source_file)
+        withdrawals = self.section_extractor.extract_withdrawals_section(text, summary, source_file, spans)
         transactions.extend(withdrawals)
 
         # Extract online banking deductions
-        online_banking = self.section_extractor.extract_online_banking_section(text, summary, source_file)
+        online_banking = self.section_extractor.extract_online_banking_section(text, summary, source_file, spans)
         transactions.extend(online_banking)
 
         if not transactions:
@@ -120,18 +128,6 @@ class PNCStatementParser(BaseStatementParser):
         logger.info(f"Extracted {len(transactions)} total transactions")
         return transactions
 
-    def _parse_month_day_year(self, month_str: str, day_str: str, year_str: str) -> datetime:
-        """Parse textual month/day/year values into a datetime object."""
-        month_str = month_str.strip()
-        day = int(day_str)
-        year = int(year_str)
-
-        try:
-            return datetime.strptime(f"{month_str} {day} {year}", '%B %d %Y')
-        except ValueError:
-            # Fallback for abbreviated month names
-            return datetime.strptime(f"{month_str} {day} {year}", '%b %d %Y')
-
     def _extract_legacy_table_transactions(self, text: str, summary: StatementSummary, source_file: str = "") -> List[Transaction]:
         """Fallback parser for legacy statements with combined credit/debit tables."""
         legacy_transactions = []
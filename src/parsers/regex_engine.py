@@ -0,0 +1,33 @@
+"""
+Optional RE2 backend for the per-line scanning patterns.
+RE2 matches in linear time without backtracking, but its \\s and \\d are ASCII-only
+(Python's also match e.g. non-breaking spaces), so it is opt-in:
+    PNC_PARSER_RE2=1   (requires google-re2 or pyre2)
+"""
+
+import logging
+import os
+import re
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+USE_RE2 = re2 is not None and os.environ.get("PNC_PARSER_RE2") == "1"
+ENGINE = "re2" if USE_RE2 else "re"
+
+
+def compile_pattern(pattern: str, ignore_case: bool = False):
+    """
+    Compile pattern with RE2 when enabled, falling back to re for patterns RE2 rejects.
+    Case-insensitivity is passed inline so both engines accept the same arguments.
+    """
+    if USE_RE2:
+        try:
+            return re2.compile(f"(?i){pattern}" if ignore_case else pattern)
+        except Exception as e:
+            logger.debug(f"RE2 rejected {pattern!r}, using re: {e}")
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 try:
     from ..models import Transaction, StatementSummary
@@ -15,6 +15,17 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Section name -> (start, end) spans of its headings, in text order
+SectionSpans = Dict[str, List[Tuple[int, int]]]
+
+
+def _first_span(spans: List[Tuple[int, int]], position: int = 0) -> Optional[Tuple[int, int]]:
+    """First span starting at or after position (spans are in text order)"""
+    for span in spans:
+        if span[0] >= position:
+            return span
+    return None
+
 
 class SectionExtractor:
     """
@@ -26,22 +37,34 @@ class SectionExtractor:
         self.patterns = patterns
         self.transaction_parser = transaction_parser
     
-    def extract_deposits_section(self, text: str, summary: StatementSummary, source_file: str = "") -> List[Transaction]:
+    def locate_sections(self, text: str) -> SectionSpans:
+        """
+        Find every section heading in a single scan of text.
+        The headings never overlap, so this matches searching for each one separately.
+        """
+        spans = {'deposits': [], 'withdrawals': [], 'online_banking': [], 'daily_balance': []}
+        for match in self.patterns.SECTION_HEADINGS.finditer(text):
+            spans[match.lastgroup].append(match.span())
+        return spans
+    
+    def extract_deposits_section(self, text: str, summary: StatementSummary, source_file: str = "",
+                                 spans: Optional[SectionSpans] = None) -> List[Transaction]:
         """Extract transactions from Deposits and Other Additions section"""
-        deposits = []
+        if spans is None:
+            spans = self.locate_sections(text)
 
         # Find deposits section
-        deposits_match = self.patterns.DEPOSITS_START.search(text)
-        if not deposits_match:
+        deposits_span = _first_span(spans['deposits'])
+        if not deposits_span:
             logger.warning("No deposits section found")
             return []
 
         # Extract section text until next major section
-        section_start = deposits_match.end()
+        section_start = deposits_span[1]
 
         # Find end of deposits section (start of withdrawals or end of text)
-        withdrawals_match = self.patterns.WITHDRAWALS_START.search(text, section_start)
-        section_end = withdrawals_match.start() if withdrawals_match else len(text)
+        withdrawals_span = _first_span(spans['withdrawals'], section_start)
+        section_end = withdrawals_span[0] if withdrawals_span else len(text)
 
         deposits_text = text[section_start:section_end]
 
@@ -56,29 +79,31 @@ class SectionExtractor:
         logger.info(f"Found {len(transactions)} deposit transactions")
         return transactions
     
-    def extract_withdrawals_section(self, text: str, summary: StatementSummary, source_file: str = "") -> List[Transaction]:
+    def extract_withdrawals_section(self, text: str, summary: StatementSummary, source_file: str = "",
+                                    spans: Optional[SectionSpans] = None) -> List[Transaction]:
         """Extract transactions from Banking/Debit Card Withdrawals section"""
-        withdrawals = []
+        if spans is None:
+            spans = self.locate_sections(text)
 
         # Find withdrawals section
-        withdrawals_match = self.patterns.WITHDRAWALS_START.search(text)
-        if not withdrawals_match:
+        withdrawals_span = _first_span(spans['withdrawals'])
+        if not withdrawals_span:
             logger.warning("No withdrawals section found")
             return []
 
         # Extract section text until next major section
-        section_start = withdrawals_match.end()
+        section_start = withdrawals_span[1]
 
         # Find end of withdrawals section (start of online banking or daily balance)
-        online_banking_match = self.patterns.ONLINE_BANKING_START.search(text, section_start)
-        daily_balance_match = self.patterns.DAILY_BALANCE_START.search(text, section_start)
+        online_banking_span = _first_span(spans['online_banking'], section_start)
+        daily_balance_span = _first_span(spans['daily_balance'], section_start)
 
         # Use the earliest next section as the end point
         section_end = len(text)
-        if online_banking_match:
-            section_end = min(section_end, online_banking_match.start())
-        if daily_balance_match:
-            section_end = min(section_end, daily_balance_match.start())
+        if online_banking_span:
+            section_end = min(section_end, online_banking_span[0])
+        if daily_balance_span:
+            section_end = min(section_end, daily_balance_span[0])
 
         withdrawals_text = text[section_start:section_end]
 
@@ -93,25 +118,27 @@ class SectionExtractor:
         logger.info(f"Found {len(transactions)} withdrawal transactions")
         return transactions
     
-    def extract_online_banking_section(self, text: str, summary: StatementSummary, source_file: str = "") -> List[Transaction]:
+    def extract_online_banking_section(self, text: str, summary: StatementSummary, source_file: str = "",
+                                       spans: Optional[SectionSpans] = None) -> List[Transaction]:
         """Extract transactions from Online and Electronic Banking Deductions section"""
-        online_banking = []
+        if spans is None:
+            spans = self.locate_sections(text)
 
         # Find online banking section
-        online_banking_match = self.patterns.ONLINE_BANKING_START.search(text)
-        if not online_banking_match:
+        online_banking_span = _first_span(spans['online_banking'])
+        if not online_banking_span:
             logger.info("No online banking section found")
             return []
 
         # Find the page number where this section starts
-        section_start_page = self._find_page_number_at_position(text, online_banking_match.start())
+        section_start_page = self._find_page_number_at_position(text, online_banking_span[0])
 
         # Extract section text until next major section (Daily Balance Detail)
-        section_start = online_banking_match.end()
+        section_start = online_banking_span[1]
 
         # Find end of online banking section
-        daily_balance_match = self.patterns.DAILY_BALANCE_START.search(text, section_start)
-        section_end = daily_balance_match.start() if daily_balance_match else len(text)
+        daily_balance_span = _first_span(spans['daily_balance'], section_start)
+        section_end = daily_balance_span[0] if daily_balance_span else len(text)
 
         online_banking_text = text[section_start:section_end]
 
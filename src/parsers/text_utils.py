@@ -1,5 +1,6 @@
 import re
 import logging
+from functools import lru_cache
 from typing import List
 
 try:
@@ -9,6 +10,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+MERCHANT_CACHE_SIZE = 4096
+
 
 class TextCleaner:
     """
@@ -47,7 +50,7 @@ class TextCleaner:
         
         # Then remove contamination patterns
         for pattern in self.contamination_patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+            cleaned = pattern.sub('', cleaned)
         
         # Clean up multiple spaces and trim
         cleaned = re.sub(r'\s+', ' ', cleaned).strip()
@@ -69,10 +72,9 @@ class TextCleaner:
         Check if a line should be ignored as extraneous text.
         Returns True if line matches any ignore pattern.
         """
-        for pattern in self.patterns.IGNORE_PATTERNS:
-            if pattern.match(line):
-                logger.debug(f"Ignoring extraneous line: '{line}'")
-                return True
+        if self.patterns.is_ignored(line):
+            logger.debug(f"Ignoring extraneous line: '{line}'")
+            return True
         
         # Additional heuristics for extraneous content
         stripped = line.strip()
@@ -157,9 +159,15 @@ class MerchantExtractor:
     
     def __init__(self, patterns: PNCPatterns):
         self.patterns = patterns
+        # Merchants repeat heavily across a year of statements; results are keyed on the exact inputs
+        self._extract_cached = lru_cache(maxsize=MERCHANT_CACHE_SIZE)(self._extract_merchant_info)
     
     def extract_merchant_info(self, description: str, transaction_type: str) -> tuple[str, str]:
         """Extract merchant name and card info from description"""
+        return self._extract_cached(description, transaction_type)
+    
+    def _extract_merchant_info(self, description: str, transaction_type: str) -> tuple[str, str]:
+        """Uncached merchant extraction"""
         merchant = "Unknown"
         card_last_four = ""
         
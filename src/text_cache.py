@@ -0,0 +1,114 @@
+"""
+On-disk cache for expensive per-PDF derived data (e.g. extracted page text).
+Entries are keyed by the source file's path, mtime and size, so edits invalidate them.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path("~/.cache/pnc-parser").expanduser()
+
+
+class TextCache:
+    """
+    Bounded pickle cache stored under cache_dir/namespace.
+    Least recently used entries are evicted once max_entries is exceeded.
+    Statement text contains account data, so callers should only enable this explicitly.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, namespace: str = "pages",
+                 max_entries: int = 512):
+        self.cache_dir = Path(cache_dir or DEFAULT_CACHE_DIR).expanduser() / namespace
+        self.max_entries = max_entries
+        self.suffix = ".pkl.zst" if zstandard else ".pkl"
+
+    def get(self, source: Path) -> Optional[Any]:
+        """Return the cached value for source, or None on miss or unreadable entry"""
+        entry = self._entry_path(source)
+        if entry is None:
+            return None
+
+        try:
+            data = entry.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        try:
+            if zstandard:
+                data = zstandard.ZstdDecompressor().decompress(data)
+            value = pickle.loads(data)
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cache entry {entry}: {e}")
+            entry.unlink(missing_ok=True)
+            return None
+
+        # Touch the entry so eviction treats it as recently used
+        os.utime(entry)
+        logger.debug(f"Cache hit for {source}")
+        return value
+
+    def put(self, source: Path, value: Any) -> None:
+        """Store value for source; failures are logged and otherwise ignored"""
+        entry = self._entry_path(source)
+        if entry is None:
+            return
+
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            if zstandard:
+                data = zstandard.ZstdCompressor().compress(data)
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent workers never read a partial entry
+            tmp_path = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, entry)
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {source}: {e}")
+            return
+
+        self._evict()
+
+    def _entry_path(self, source: Path) -> Optional[Path]:
+        """Cache file path for source, or None if source cannot be stat'ed"""
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+
+        key = hashlib.blake2b(
+            str(Path(source).resolve()).encode() + str(stat.st_mtime_ns).encode() + str(stat.st_size).encode(),
+            digest_size=8
+        ).hexdigest()
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _evict(self) -> None:
+        """Remove least recently used entries beyond max_entries"""
+        try:
+            entries = [(e.stat().st_mtime_ns, e.path) for e in os.scandir(self.cache_dir)
+                       if e.name.endswith(self.suffix)]
+        except OSError:
+            return
+
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+
+        entries.sort()
+        for _, path in entries[:excess]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        logger.debug(f"Evicted {excess} cache entries from {self.cache_dir}")
@@ -4,8 +4,9 @@ Provides smart file discovery and year boundary transaction filtering.
 """
 
 import logging
+import os
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Iterator, List, Optional, Set
 from datetime import datetime
 
 try:
@@ -16,6 +17,14 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def iter_pdf_files(directory: Path) -> Iterator[Path]:
+    """Lazily yield PDF files in a directory using os.scandir (no per-entry stat on Linux)"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith('.pdf') and entry.is_file():
+                yield Path(entry.path)
+
+
 class YearProcessor:
     """
     Handles year-specific processing logic including file discovery
@@ -71,12 +80,7 @@ class YearProcessor:
         if not directory.exists():
             return []
         
-        pdf_files = []
-        for file_path in directory.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in self.supported_extensions:
-                pdf_files.append(file_path)
-        
-        return pdf_files
+        return list(iter_pdf_files(directory))
     
     def _is_likely_january_statement(self, file_path: Path) -> bool:
         """
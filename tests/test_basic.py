@@ -5,6 +5,7 @@ Tests core modules without requiring actual PDF files.
 """
 
 import sys
+import tempfile
 from pathlib import Path
 from decimal import Decimal
 from datetime import datetime
@@ -13,7 +14,7 @@ from datetime import datetime
 parent_path = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_path))
 
-from src.models import Transaction, StatementSummary
+from src.models import Transaction, StatementSummary, TransactionBatch, TYPE_CREDIT, TYPE_DEBIT
 from src.parsers import PNCStatementParser
 from src.data_processor import DataProcessor
 from src.csv_exporter import CSVExporter
@@ -44,6 +45,10 @@ def test_transaction_model():
     # Test signed_amount property
     assert transaction.signed_amount == Decimal("38.87"), f"Expected 38.87, got {transaction.signed_amount}"
     
+    # Test amount_cents property
+    assert transaction.amount_cents == 3887, f"Expected 3887, got {transaction.amount_cents}"
+    assert transaction.signed_cents == 3887, f"Expected 3887, got {transaction.signed_cents}"
+    
     print("✓ Transaction model tests passed")
 
 
@@ -73,6 +78,27 @@ def test_parser_patterns():
     print("✓ Parser pattern tests passed")
 
 
+def test_parse_all_header():
+    """Test parse_all shares the header parse and finds headers past the scan window"""
+    print("Testing parse_all header handling...")
+    
+    parser = PNCStatementParser()
+    header = "Primary account number: 12-3456-7890\nFor the period 12/01/2022 to 12/31/2022\nPage 1 of 3\n"
+    
+    transactions, summary = parser.parse_all(header)
+    assert summary is not None, "Header should parse"
+    assert summary.account_number == "12-3456-7890", f"Unexpected account: {summary.account_number}"
+    assert transactions == [], "Header-only text should have no transactions"
+    
+    padded = ("filler line\n" * 1000) + header
+    summary = parser.parse_account_info(padded)
+    assert summary is not None and summary.total_pages == 3, "Header beyond the scan window should still parse"
+    
+    assert parser.parse_all("no header here") == ([], None), "Missing header should yield no transactions"
+    
+    print("✓ parse_all header tests passed")
+
+
 def test_data_processor():
     """Test DataProcessor functionality"""
     print("Testing data processor...")
@@ -100,6 +126,18 @@ def test_data_processor():
     assert len(cleaned) == 2, f"Expected 2 transactions, got {len(cleaned)}"
     assert cleaned[0].description == "Test Description", f"Description not cleaned properly: '{cleaned[0].description}'"
     
+    # Test cross-file dedupe: repeats within a file survive, repeats from another file are dropped
+    seen = {}
+    kept = processor.drop_cross_file_duplicates(cleaned + cleaned[:1], "a.pdf", seen)
+    assert len(kept) == 3, f"Expected same-file repeats to be kept, got {len(kept)}"
+    kept = processor.drop_cross_file_duplicates(cleaned, "b.pdf", seen)
+    assert len(kept) == 0, f"Expected cross-file duplicates to be dropped, got {len(kept)}"
+    
+    # Test duplicate detection: repeats of the same row are grouped together
+    duplicates = processor._find_duplicates(cleaned + cleaned[:1] + cleaned[:1])
+    assert len(duplicates) == 1, f"Expected one duplicate group, got {len(duplicates)}"
+    assert len(duplicates[0]) == 3, f"Expected all three repeats in the group, got {len(duplicates[0])}"
+    
     print("✓ Data processor tests passed")
 
 
@@ -137,9 +175,51 @@ def test_csv_exporter():
     debit_row = next(row for row in formatted if row['Type'] == 'DEBIT')
     assert debit_row['Amount'] == -25.00, f"Expected -25.00, got {debit_row['Amount']}"
     
+    # Columnar batches export identically and total in integer cents
+    batch = TransactionBatch.from_transactions(transactions)
+    assert exporter.format_data_for_export(batch) == formatted, "Expected batch export to match list export"
+    assert batch.total_cents(TYPE_CREDIT) == 3887, f"Expected 3887, got {batch.total_cents(TYPE_CREDIT)}"
+    assert batch.total_cents(TYPE_DEBIT) == 2500, f"Expected 2500, got {batch.total_cents(TYPE_DEBIT)}"
+    
     print("✓ CSV exporter tests passed")
 
 
+def test_stream_matches_list_export():
+    """Streamed CSVs are byte-identical to the list-based exports"""
+    print("Testing streamed CSV export...")
+    
+    exporter = CSVExporter()
+    transactions = [
+        Transaction(
+            date=date, year=year, month=month, amount=Decimal(amount),
+            transaction_type=kind, description=f'Test "{kind}", {date}',
+            merchant="Test Merchant", card_last_four="3767", category="Other",
+            raw_lines=["test"], page_number=1, source_file="test.pdf"
+        )
+        for date, year, month, amount, kind in [
+            ("01/03", 2023, 1, "12.50", "DEBIT"),
+            ("12/09", 2022, 12, "25.00", "DEBIT"),
+            ("12/08", 2022, 12, "38.87", "CREDIT"),
+        ]
+    ]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        exporter.create_google_sheets_compatible_format(transactions, tmp / "list.csv")
+        exporter.export_monthly_files(transactions, tmp / "list_monthly")
+        with exporter.open_stream(tmp / "stream.csv", tmp / "stream_monthly") as stream:
+            stream.append(transactions)
+        
+        assert (tmp / "stream.csv").read_bytes() == (tmp / "list.csv").read_bytes(), \
+            "Expected streamed CSV to match create_google_sheets_compatible_format"
+        for month_file in sorted((tmp / "list_monthly").rglob("*.csv")):
+            streamed = tmp / "stream_monthly" / month_file.relative_to(tmp / "list_monthly")
+            assert streamed.read_bytes() == month_file.read_bytes(), \
+                f"Expected streamed {streamed.name} to match export_monthly_files"
+    
+    print("✓ Streamed CSV export tests passed")
+
+
 def main():
     """Run all basic tests"""
     print("Running basic functionality tests for PNC Statement Parser\n")
@@ -147,8 +227,10 @@ def main():
     try:
         test_transaction_model()
         test_parser_patterns()
+        test_parse_all_header()
         test_data_processor()
         test_csv_exporter()
+        test_stream_matches_list_export()
         
         print("\n✅ All basic tests passed! Core functionality is working.")
         print("\nNext steps:")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for TransactionCategorizer pattern matching.
+Uses the bundled src/categories.json.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+# Add parent directory to Python path
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.parsers import categorization
+from src.parsers.categorization import TransactionCategorizer
+
+
+class FakeAutomaton:
+    """Minimal stand-in for ahocorasick.Automaton, so the literal matcher runs without pyahocorasick"""
+
+    def __init__(self):
+        self.words = {}
+
+    def add_word(self, key, value):
+        self.words[key] = value
+
+    def get(self, key, default=None):
+        return self.words.get(key, default)
+
+    def __len__(self):
+        return len(self.words)
+
+    def make_automaton(self):
+        pass
+
+    def iter(self, haystack):
+        for key, value in self.words.items():
+            start = haystack.find(key)
+            while start != -1:
+                yield start + len(key) - 1, value
+                start = haystack.find(key, start + 1)
+
+
+def test_case_insensitive_matching():
+    """Patterns match regardless of description case"""
+    print("Testing case-insensitive matching...")
+
+    categorizer = TransactionCategorizer()
+
+    assert categorizer.categorize_transaction("NETFLIX.COM 866-579-7172 CA") == "Media"
+    assert categorizer.categorize_transaction("netflix.com 866-579-7172 ca") == "Media"
+
+    print("✓ Case-insensitive matching tests passed")
+
+
+def test_regex_escapes_preserved():
+    """Escapes like \\d keep their meaning instead of being upper-cased to \\D"""
+    print("Testing regex escapes...")
+
+    categorizer = TransactionCategorizer()
+
+    assert categorizer.categorize_transaction("BP#1234567 CLEVELAND OH") == "Transportation"
+    assert categorizer.categorize_transaction("BP# CLEVELAND OH") != "Transportation"
+
+    print("✓ Regex escape tests passed")
+
+
+def test_invalid_pattern_and_priority():
+    """Invalid regexes fall back to literal matching; earlier categories win"""
+    print("Testing invalid patterns and category priority...")
+
+    categorizer = TransactionCategorizer()
+    categorizer.categories = {}
+    categorizer.add_category("First", ["Shop("])
+    categorizer.add_category("Second", ["Shop"])
+
+    assert categorizer.categorize_transaction("corner shop( 42") == "First"
+    assert categorizer.categorize_transaction("corner shop 42") == "Second"
+    assert categorizer.categorize_transaction("no match here") == "Other"
+
+    # Adding a category must invalidate previously cached results
+    categorizer.add_category("Third", ["no match"])
+    assert categorizer.categorize_transaction("no match here") == "Third"
+
+    print("✓ Invalid pattern and priority tests passed")
+
+
+def test_shared_file_cache_isolation():
+    """Categorizers loading the same file share its parse but not each other's edits"""
+    print("Testing shared categories cache...")
+
+    first = TransactionCategorizer()
+    second = TransactionCategorizer()
+    second.add_category("Custom", ["zzz-custom"])
+
+    assert second.categorize_transaction("zzz-custom") == "Custom"
+    assert first.categorize_transaction("zzz-custom") == "Other"
+    assert "Custom" not in TransactionCategorizer().get_categories()
+
+    print("✓ Shared categories cache tests passed")
+
+
+def test_literal_automaton_priority():
+    """The Aho-Corasick path keeps file-order priority and is rebuilt by add_category"""
+    print("Testing literal automaton matching...")
+
+    saved = categorization.ahocorasick
+    categorization.ahocorasick = types.SimpleNamespace(Automaton=FakeAutomaton)
+    try:
+        categorizer = TransactionCategorizer()
+        categorizer.categories = {}
+        categorizer.add_category("Early", [r"store #\d+"])
+        categorizer.add_category("Late", ["Corner Store"])
+
+        automaton, _, _ = categorizer._literal_matcher
+        assert "CORNER STORE" in automaton.words, "Expected the literal in the automaton"
+
+        # Literal in a later category and regex in an earlier one both match: file order wins
+        assert categorizer.categorize_transaction("corner store #42") == "Early"
+        assert categorizer.categorize_transaction("corner store") == "Late"
+        assert categorizer.categorize_transaction("nothing") == "Other"
+
+        categorizer.add_category("Added", ["nothing"])
+        automaton, _, _ = categorizer._literal_matcher
+        assert "NOTHING" in automaton.words, "Expected add_category to rebuild the automaton"
+        assert categorizer.categorize_transaction("nothing") == "Added"
+    finally:
+        categorization.ahocorasick = saved
+
+    print("✓ Literal automaton tests passed")
+
+
+def main():
+    """Run categorization tests"""
+    print("Running categorization tests\n")
+
+    try:
+        test_case_insensitive_matching()
+        test_regex_escapes_preserved()
+        test_invalid_pattern_and_priority()
+        test_shared_file_cache_isolation()
+        test_literal_automaton_priority()
+
+        print("\n✅ All categorization tests passed!")
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
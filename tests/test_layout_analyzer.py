@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Import smoke tests for experiments/layout_analyzer.py.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+
+def test_import_as_package():
+    """The analyzer imports from the repository root"""
+    print("Testing package import...")
+
+    from experiments.layout_analyzer import LayoutAnalyzer
+
+    assert LayoutAnalyzer().backend == 'pdfplumber'
+
+    print("✓ Package import tests passed")
+
+
+def test_import_from_experiments_dir():
+    """The analyzer imports as a top-level module from inside experiments/"""
+    print("Testing import from experiments/...")
+
+    result = subprocess.run(
+        [sys.executable, "-c", "import layout_analyzer"],
+        cwd=parent_path / "experiments", capture_output=True, text=True
+    )
+    assert result.returncode == 0, f"Import failed: {result.stderr}"
+
+    print("✓ experiments/ import tests passed")
+
+
+def test_pdfium_is_optional():
+    """Without pypdfium2 the module imports and only backend='pdfium' fails"""
+    print("Testing optional pypdfium2...")
+
+    code = (
+        "import sys; sys.modules['pypdfium2'] = None; sys.modules['pypdfium2.raw'] = None\n"
+        "from experiments.layout_analyzer import LayoutAnalyzer\n"
+        "LayoutAnalyzer()\n"
+        "try:\n"
+        "    LayoutAnalyzer(backend='pdfium')\n"
+        "except ImportError:\n"
+        "    pass\n"
+        "else:\n"
+        "    sys.exit('expected ImportError')\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=parent_path,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, f"Optional pypdfium2 check failed: {result.stderr}"
+
+    print("✓ Optional pypdfium2 tests passed")
+
+
+def main():
+    """Run layout analyzer import tests"""
+    print("Running layout analyzer import tests\n")
+
+    try:
+        test_import_as_package()
+        test_import_from_experiments_dir()
+        test_pdfium_is_optional()
+
+        print("\n✅ All layout analyzer import tests passed!")
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk TextCache.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path
+parent_path = Path(__file__).parent.parent
+sys.path.insert(0, str(parent_path))
+
+from src.text_cache import TextCache
+
+
+def test_round_trip_and_invalidation():
+    """Cached values are returned until the source file changes"""
+    print("Testing cache round trip...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        source = tmp / "statement.pdf"
+        source.write_bytes(b"%PDF-1.4 original")
+
+        cache = TextCache(tmp / "cache")
+        assert cache.get(source) is None, "Expected a miss on an empty cache"
+
+        cache.put(source, ["page one", "page two"])
+        assert cache.get(source) == ["page one", "page two"], "Expected cached pages"
+
+        source.write_bytes(b"%PDF-1.4 changed contents")
+        assert cache.get(source) is None, "Expected a miss after the source changed"
+
+    print("✓ Cache round trip tests passed")
+
+
+def test_eviction():
+    """Oldest entries are evicted beyond max_entries"""
+    print("Testing cache eviction...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        cache = TextCache(tmp / "cache", max_entries=2)
+
+        sources = []
+        for i in range(3):
+            source = tmp / f"statement_{i}.pdf"
+            source.write_bytes(f"%PDF-1.4 {i}".encode())
+            cache.put(source, [str(i)])
+            # Space out entry mtimes so eviction order is deterministic
+            os.utime(cache._entry_path(source), ns=(i * 10**9, i * 10**9))
+            sources.append(source)
+
+        assert cache.get(sources[0]) is None, "Expected the oldest entry to be evicted"
+        assert cache.get(sources[2]) == ["2"], "Expected the newest entry to remain"
+
+    print("✓ Cache eviction tests passed")
+
+
+def main():
+    """Run text cache tests"""
+    print("Running text cache tests\n")
+
+    try:
+        test_round_trip_and_invalidation()
+        test_eviction()
+
+        print("\n✅ All text cache tests passed!")
+
+    except AssertionError as e:
+        print(f"\n❌ Test failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()